@@ -1,105 +1,217 @@
 #!/bin/python3
 
+import hashlib
+import json
+import os
+import sys
+
+import instdb
+
 SOURCE: str = 'http://ref.x86asm.net/coder32.html'
 
-def parse_html(html: str):
+# Content-addressed store of downloaded pages and their parsed tables:
+#   <sha256 of page>.html
+#   <sha256 of page>.<sha256 of the fetch scripts>.<json|idb>
+#   index.json - last known hash and HTTP validators of every source
+CACHE: str = os.environ.get('X86_CACHE') or os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), '.cache')
+
+def parse_tables(html: str, chunk_size: int = 1 << 16):
+    """Yields (table index, row) for the first row of every <tbody>.
+
+    Rows are emitted as soon as their </tbody> is seen, cells are keyed by the
+    title of the matching <th> and empty cells are left out.
+    """
     from html.parser import HTMLParser
 
     class Parser(HTMLParser):
-        def __init__(self, *, convert_charrefs: bool = True) -> None:
-            super().__init__(convert_charrefs=convert_charrefs)
-
-            self.dom = {}
-            self.cur = [self.dom]
+        def __init__(self) -> None:
+            super().__init__(convert_charrefs=True)
+
+            self.rows = []
+            self.table = -1
+            self.section = None
+            self.cols = []
+            self.row = None
+            self.tr = 0
+            self.col = 0
+            self.span = 1
+            self.text = None
+            self.data = []
+
+        def end_data(self):
+            # a text node can be split across feed() calls, only separate
+            # the text of different elements
+            if self.data:
+                self.text.append(''.join(self.data))
+                self.data = []
+
+        def end_cell(self):
+            if self.text is not None:
+                self.end_data()
+                text = ' '.join(self.text)
+                if text and self.col < len(self.cols):
+                    self.row[self.cols[self.col]] = text
+                self.col += self.span
+                self.text = None
 
         def handle_starttag(self, tag: str, attrs):
-            def append(list: list, item) -> list:
-                if list:
-                    list.append(item)
-                    return list
-                else:
-                    return [item]
-
-            attr_objs = {}
-            for k, v in attrs:
-                attr_objs[k] = append(attr_objs.get(k), v)
-
-            element = {
-                '.tag': tag,
-                '.attr': attr_objs,
-                '.data': None
-            }
-
-            self.cur[-1][tag] = append(self.cur[-1].get(tag), element)
-            self.cur.append(element)
+            if tag in ('td', 'th', 'tr', 'tbody', 'thead', 'table'):
+                self.end_cell()
+            elif self.text is not None:
+                self.end_data()
+
+            if tag == 'table':
+                self.table += 1
+                self.cols = []
+            elif tag in ('thead', 'tbody'):
+                self.section = tag
+                self.tr = 0
+                self.row = {} if tag == 'tbody' else None
+            elif tag == 'tr':
+                self.tr += 1
+                self.col = 0
+            elif tag == 'th' and self.section == 'thead':
+                self.cols.append(dict(attrs).get('title'))
+            elif tag == 'td' and self.row is not None and self.tr == 1:
+                self.span = int(dict(attrs).get('colspan') or 1)
+                self.text = []
 
         def handle_endtag(self, tag: str):
-            while len(self.cur) != 0 and self.cur[-1]['.tag'] != tag:
-                self.cur.pop()
-            
-            assert len(self.cur) != 0
-            self.cur.pop()
+            if tag in ('td', 'tr', 'tbody', 'table'):
+                self.end_cell()
+            elif self.text is not None:
+                self.end_data()
+
+            if tag == 'tbody' and self.row is not None:
+                self.rows.append((self.table, self.row))
+                self.row = None
+                self.section = None
 
         def handle_data(self, data):
-            self.cur[-1]['.data'] = data
-        
+            if self.text is not None and data:
+                self.data.append(data)
+
     parser = Parser()
-    parser.feed(html)
-    return parser.dom
-
-def inner_text(html: dict) -> list:
-    result = []
-    for k, inner in html.items():
-        if k.startswith('.'):
-            continue
-
-        for v in inner:
-            result += inner_text(v)
-
-    return result + ([html['.data']] if '.data' in html and html['.data'] else [])
-
-def parse_table(table: dict) -> list[dict]:
-    thead = table['thead'][0]['tr'][0]
-    cols = []
-    for th in thead['th']:
-        cols.append(th['.attr']['title'][0])
-
-    entries = []
-    for tbody in table['tbody']:
-        entry = {}
-        i = 0
-        for td in tbody['tr'][0]['td']:
-            entry[cols[i]] = ' '.join(inner_text(td)) or None
-            if 'colspan' in td['.attr']:
-                i += int(td['.attr']['colspan'][0])
-            else:
-                i += 1
-
-        entries.append(entry)
-
-    return entries
-
-def del_nones(obj):
-    if type(obj) is dict:
-        return {k: del_nones(v) for k, v in obj.items() if v != None}
-    elif type(obj) is list:
-        return [del_nones(v) for v in obj if v != None]
-    else:
-        return obj
+    for i in range(0, len(html), chunk_size):
+        parser.feed(html[i:i + chunk_size])
+        yield from parser.rows
+        parser.rows.clear()
+
+    parser.close()
+    yield from parser.rows
+
+def check_chunking(html: str, chunk_size: int = 7):
+    """Parses html in chunk_size pieces and in one piece, they must agree.
+
+    A small chunk_size splits tags and text nodes across feed() calls.
+    """
+    whole = list(parse_tables(html, len(html) or 1))
+    chunked = list(parse_tables(html, chunk_size))
+    if len(chunked) != len(whole):
+        raise SystemExit(f'{len(chunked)} rows with chunk size {chunk_size}, {len(whole)} in one piece')
+    for i, (expected, row) in enumerate(zip(whole, chunked)):
+        if expected != row:
+            raise SystemExit(f'row {i} differs with chunk size {chunk_size}: {row} != {expected}')
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def cache_path(name: str) -> str:
+    return os.path.join(CACHE, name)
+
+def cache_write(name: str, data: bytes):
+    os.makedirs(CACHE, exist_ok=True)
+    tmp = cache_path(f'.{name}.{os.getpid()}')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, cache_path(name))
+
+def load_index() -> dict:
+    try:
+        with open(cache_path('index.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def fetch_html(source: str, offline: bool) -> str:
+    index = load_index()
+    entry = index.get(source, {})
+    cached = 'sha256' in entry and os.path.exists(cache_path(f'{entry["sha256"]}.html'))
+
+    if offline:
+        if not cached:
+            raise SystemExit(f'{source} is not cached, run once without --offline')
+        return entry['sha256']
 
-def parse_instructions():
     import requests
 
-    dom = parse_html(requests.get(SOURCE).text)
-    tables = dom['html'][0]['body'][0]['table']
-    tab1 = parse_table(tables[0])
-    tab2 = parse_table(tables[1])
-    return del_nones(tab1 + tab2)
+    headers = {}
+    if cached and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if cached and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        response = requests.get(source, headers=headers, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if not cached:
+            raise SystemExit(f'{source}: {e}')
+        print(f'warning: {source}: {e}, using the cached copy', file=sys.stderr)
+        return entry['sha256']
+    if response.status_code == 304:
+        return entry['sha256']
+
+    html = response.text.encode()
+    sha = digest(html)
+    if not os.path.exists(cache_path(f'{sha}.html')):
+        cache_write(f'{sha}.html', html)
+
+    index[source] = {
+        'sha256': sha,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    cache_write('index.json', json.dumps(index, indent=4).encode())
+    return sha
+
+def parse_instructions(html: str) -> list[dict]:
+    # one-byte and two-byte (0F) opcode tables
+    return [row for table, row in parse_tables(html) if table < 2]
+
+def encode(rows: list[dict], format: str) -> bytes:
+    if format == 'idb':
+        return instdb.dumps(rows)
+    return (json.dumps(rows, indent=4) + '\n').encode()
 
 if __name__ == '__main__':
-    import json
-    import os
-    import sys
+    import argparse
+
+    args = argparse.ArgumentParser(description='Print the instruction table of ' + SOURCE)
+    args.add_argument('--offline', action='store_true', help='use the cached page, never touch the network')
+    args.add_argument('--source', default=SOURCE, help='page to fetch (default: %(default)s)')
+    args.add_argument('--format', choices=['json', 'idb'], default='json', help='output format (default: %(default)s)')
+    args.add_argument('-o', '--output', help='write to a file instead of stdout')
+    args = args.parse_args()
+
+    html_sha = fetch_html(args.source, args.offline)
+
+    script = hashlib.sha256()
+    for module in (__file__, instdb.__file__):
+        with open(os.path.realpath(module), 'rb') as f:
+            script.update(f.read())
+    parsed = f'{html_sha}.{script.hexdigest()}.{args.format}'
+
+    if os.path.exists(cache_path(parsed)):
+        with open(cache_path(parsed), 'rb') as f:
+            data = f.read()
+    else:
+        with open(cache_path(f'{html_sha}.html'), encoding='utf-8') as f:
+            data = encode(parse_instructions(f.read()), args.format)
+        cache_write(parsed, data)
 
-    dir = os.path.dirname(os.path.realpath(sys.argv[0]))
-    print(json.dumps(parse_instructions(), indent=4))
+    if args.output:
+        with open(args.output, 'wb') as f:
+            f.write(data)
+    else:
+        sys.stdout.buffer.write(data)
@@ -1,9 +1,16 @@
 #!/bin/python3
 
+import argparse
+import hashlib
+import itertools
 import json
+import multiprocessing
+import os
 import sys
 import re
 
+import instdb
+
 class Obj:
     pass
 
@@ -81,12 +88,14 @@ def preproccess(inst) -> Obj:
     return new
 
 
-insts = []
-for inst in json.load(sys.stdin):
-    try:
-        insts.append(preproccess(inst))
-    except:
-        pass
+def load_instructions(path = None) -> list[dict]:
+    if path:
+        return instdb.Table.open(path).rows()
+
+    data = sys.stdin.buffer.read()
+    if data.startswith(instdb.MAGIC):
+        return instdb.Table(data).rows()
+    return json.loads(data)
 
 def mod_rm(mod, reg, rm):
     res = Obj()
@@ -96,2037 +105,971 @@ def mod_rm(mod, reg, rm):
 
     return res
 
-def instruction(inst, **overload) -> list[str]:
-    def get(name, default=None):
-        return overload.get(name, getattr(inst, name, default))
-    
-    res_bytes = []
+def vex_prefix(inst, RXBWL: str, vvvv = None) -> list:
+    if not inst.pref_0F:
+        raise Exception("VEX prefix is not expected")
+
+    map_select = '00001'
+    if len(inst.opcode) == 2 and inst.opcode[0] == 0x38:
+        map_select = '00010'
+    elif len(inst.opcode) == 2 and inst.opcode[0] == 0x3A:
+        map_select = '00011'
+
+    pp = '00'
+    if inst.pref == '66':
+        pp = '01'
+    elif inst.pref == 'F3':
+        pp = '10'
+    elif inst.pref == 'F2':
+        pp = '11'
+
+    r, nr = 'R' in RXBWL and (1, 0) or (0, 1)
+    x, nx = 'X' in RXBWL and (1, 0) or (0, 1)
+    b, nb = 'B' in RXBWL and (1, 0) or (0, 1)
+    w, nw = 'W' in RXBWL and (1, 0) or (0, 1)
+    l, nl = 'L' in RXBWL and (1, 0) or (0, 1)
+
+    vvvv = vvvv or '0b1111'
+
+    if [x, b, w, map_select] == [0, 0, 0, '00001']:
+        return [f'0xC5', f'0b{nr}0000000 | (~{vvvv} & 0b1111)<<3 | 0b{l}{pp}']
+    else:
+        return [f'0xC4', int(f'{nr}{nx}{nb}{map_select}', 2), f'0b{w}0000{l}{pp} | ((~{vvvv} & 0b1111) << 3)']
+
+def memory_instruction(inst, form) -> list[str]:
+    prefixes = []
+    if inst.pref:
+        prefixes += [f'0x{inst.pref}']
+    if form.szovrd and inst.pref != '66':
+        prefixes += ['0x%02X' % SZOVRD]
+
+    opcode = [*(inst.pref_0F and [f'0x{inst.pref_0F}'] or []), *['0x%02X' % b for b in inst.opcode]]
+    reg = form.reg
+    if reg is None:
+        reg = inst.reg_const or 0
+
+    args = [
+        '{' + ', '.join(prefixes) + '}', '0x%02X' % form.rex, '{' + ', '.join(opcode) + '}',
+        str(reg), form.mem, '{' + ', '.join(form.imm) + '}',
+    ]
 
-    mandatory_pref = get('mandatory_pref')
-    vex = get('vex')
-    if mandatory_pref and not vex:
-        res_bytes += ['0x%02X' % b for b in mandatory_pref]
-    
-    pref_0F = get('pref_0F')
-    if pref_0F and not vex:
-        res_bytes += [f'0x{pref_0F}']
+    return [
+        '',
+        f'// {inst.mnemonic} {", ".join(inst.ops)}; {inst.description}',
+        f'static constexpr Encoding {inst.mnemonic}({", ".join(form.args)})' + '{',[
+            f'return Encoding({", ".join(args)});',
+        ], '}'
+    ]
 
-    res_bytes += ['0x%02X' % b if type(b) is int else b for b in get('prefix', [])]
+def instruction(inst, form) -> list[str]:
+    if form.mem:
+        return memory_instruction(inst, form)
 
-    if vex:
-        res_bytes += ['0x%02X' % b if type(b) is int else b for b in vex]
+    res_bytes = []
 
     opcode = ['0x%02X' % b for b in inst.opcode]
 
-    if get('reg_in_op', False):
+    if form.vex:
+        res_bytes += ['0x%02X' % b if type(b) is int else b for b in vex_prefix(inst, *form.vex)]
+        if len(inst.opcode) == 2 and inst.opcode[0] in (0x38, 0x3A):
+            opcode = opcode[1:]
+    else:
+        if inst.pref:
+            res_bytes += [f'0x{inst.pref}']
+        if form.szovrd and inst.pref != '66':
+            res_bytes += ['0x%02X' % SZOVRD]
+        if form.rex:
+            res_bytes += ['0x%02X' % form.rex]
+        if inst.pref_0F:
+            res_bytes += [f'0x{inst.pref_0F}']
+
+    if form.reg_in_op:
         opcode[-1] = f'U8({opcode[-1]}) + reg.id'
 
     res_bytes += opcode
 
-    mod_rm = get('mod_rm', None)
-    mod = mod_rm and mod_rm.mod
-    if mod_rm:
-        mod_rm = f'mod_rm({f"{bin(mod)}"}, {mod_rm.reg}, {mod_rm.rm})'
-        res_bytes += [mod_rm]
-
-    sib = get('sib', None)
-    if sib:
-        sib = f'sib({sib["scale"]}, {sib["index"]}, {sib["base"]})'
-        res_bytes += [sib]
+    mod = form.mod_rm and form.mod_rm.mod
+    if form.mod_rm:
+        reg = form.mod_rm.reg
+        if reg is None:
+            reg = inst.reg_const or 0
+        res_bytes += [f'mod_rm({bin(mod)}, {reg}, {form.mod_rm.rm})']
 
-    disp = get('disp', [])
-    if disp:
-        res_bytes += disp
+    if form.sib:
+        res_bytes += [f'sib({form.sib["scale"]}, {form.sib["index"]}, {form.sib["base"]})']
 
-    imm = get('imm', None)
-    if imm:
-        res_bytes += imm
+    res_bytes += form.disp
+    res_bytes += form.imm
 
-    lock = get('lock', False)
-
-    args: str =  ', '.join(get('args', []))
+    lock = inst.lock_fpush_fpop == 'L'
+    mnemonic = form.vex and f'V{inst.mnemonic}' or inst.mnemonic
 
     ret = f'Instruction<{len(res_bytes)}, {lock and mod != 0b11 and "true" or "false"}>'
 
-    return [
+    res = [
         '',
-        f'// {get("mnemonic")} {", ".join(get("ops"))}; {get("description")}',
-        f'static constexpr {ret} {get("mnemonic")}({args})' + '{',[
+        f'// {mnemonic} {", ".join(inst.ops)}; {inst.description}',
+        f'static constexpr {ret} {mnemonic}({", ".join(form.args)})' + '{',[
             f'return {ret}' + '{' + ', '.join([ f'U8({b})' for b in res_bytes]) + '};',
         ], '}'
     ]
 
+    # branches to a label, the Assembler patches the displacement. Intel CPUs
+    # ignore the operand size prefix of near branches in 64-bit mode and still
+    # read a rel32, so the 66 rel16 forms get no label overload.
+    if len(form.types) == 1 and form.types[0].startswith('REL') and len(form.imm) != 2:
+        size = len(form.imm)
+        res += [
+            f'static constexpr Branch<{len(res_bytes)}, {size}> {mnemonic}(LabelRef<{size}> rel)' + '{',[
+                f'return Branch<{len(res_bytes)}, {size}>{{{mnemonic}({form.types[0]}{{}}), rel.id}};',
+            ], '}'
+        ]
+
+    return res
+
 def arr(var, count, first = 0):
     return [f'{var}[{i}]' for i in range(first, first + count)]
 
+def operand(role, cls = None, width = None, memory = False):
+    res = Obj()
+    res.role = role
+    res.cls = cls
+    res.width = width
+    res.memory = memory
+
+    return res
+
+# Operand kinds of the reference tables. A width of None follows the operand
+# size of the instruction (16/32/64), every other field is fixed by the kind.
+# memory is the size of the memory operand, True if it is the operand size.
+OPERAND_KINDS = {
+    '1': operand('implicit'),
+    'ST': operand('implicit'),
+    'imm8': operand('imm', width=8),
+    'imm16': operand('imm', width=16),
+    'imm16/32': operand('imm'),
+    'rel8': operand('rel', width=8),
+    'rel16/32': operand('rel'),
+    'r8': operand('reg', 'gp', 8),
+    'r16/32': operand('reg', 'gp'),
+    'r32': operand('reg', 'gp', 32),
+    '#r16/32': operand('opreg', 'gp'),
+    'r/m8': operand('rm', 'gp', 8),
+    'r/m16': operand('rm', 'gp', 16, memory=True),
+    'r/m32': operand('rm', 'gp', 32, memory=True),
+    'r/m16/32': operand('rm', 'gp', memory=True),
+    'mm': operand('reg', 'mm', 64),
+    'mm/m64': operand('rm', 'mm', 64, memory=64),
+    'xmm': operand('reg', 'xmm', 128),
+    'xmm/m32': operand('rm', 'xmm', 128, memory=32),
+    'xmm/m64': operand('rm', 'xmm', 128, memory=64),
+    'xmm/m128': operand('rm', 'xmm', 128, memory=128),
+    **{m: operand('mem', memory=width) for m, width in {
+        'm': 0, 'm8': 8, 'm16': 16, 'm32': 32, 'm64': 64, 'm128': 128,
+        'm16int': 16, 'm32int': 32, 'm64int': 64, 'm32real': 32, 'm64real': 64, 'm80real': 80, 'm80dec': 80,
+    }.items()},
+}
+
+OPERAND_NAMES = {
+    ('reg', 'gp'): 'reg', ('reg', 'xmm'): 'xmm', ('reg', 'mm'): 'mm', ('opreg', 'gp'): 'reg',
+    ('rm', 'gp'): 'rm', ('rm', 'xmm'): 'xmmm', ('rm', 'mm'): 'mmm', ('mem', None): 'rm',
+    ('imm', None): 'imm', ('rel', None): 'rel',
+}
+
+REGISTER_TYPES = {'gp': 'Reg{width}', 'xmm': 'XMM', 'ymm': 'YMM', 'mm': 'MM'}
+EXTENDABLE = {'gp', 'xmm', 'ymm'}
+
+def alternative(arg, rex = 0, **fields):
+    res = Obj()
+    res.arg = arg
+    res.rex = rex
+    res.fields = fields
+
+    return res
+
+def register_alternatives(cls, width, name, field, rex_bit, direct = False):
+    res = []
+    for ext in (cls in EXTENDABLE) and [False, True] or [False]:
+        reg_type = ext and 'E' or ''
+        reg_type += REGISTER_TYPES[cls].format(width=width)
+        fields = {field: f'{name}.id'}
+        if field == 'rm':
+            fields['mod'] = 0b11
+        if direct:
+            rm_type = cls == 'gp' and reg_type.replace('Reg', 'RegRm') or reg_type + 'M'
+            res.append(alternative(f'{rm_type} {name}', ext and rex_bit, **fields))
+        res.append(alternative(f'{reg_type} {name}', ext and rex_bit, **fields))
+
+    return res
+
+def memory_alternatives(width, name):
+    res = []
+    displacements = [('Indir', 0b00, 0), ('Disp8', 0b01, 1), (width == 16 and 'Disp16' or 'Disp32', 0b10, width == 16 and 2 or 4)]
+    for ext in [False, True]:
+        base = f'{ext and "E" or ""}RegRm{width}'
+        for suffix, mod, disp in displacements:
+            res.append(alternative(f'{base}{suffix} {name}', ext and REX_B, rm=f'{name}.id', mod=mod, disp=arr(f'{name}.disp', disp)))
+
+    if width == 16:
+        return res
+
+    sib = {'scale': f'{name}.scale', 'index': f'{name}.index.id', 'base': f'{name}.id'}
+    for ext in [False, True]:
+        for index_ext in [False, True]:
+            base = f'{ext and "E" or ""}RegRm{width}'
+            index = f'{index_ext and "E" or ""}Reg{width}'
+            for suffix, mod, disp in displacements:
+                res.append(alternative(
+                    f'SIB<{base}{suffix}, {index}> {name}', (ext and REX_B) | (index_ext and REX_X),
+                    rm=0b100, mod=mod, sib=sib, disp=arr(f'{name}.disp', disp),
+                ))
+
+    return res
+
+def runtime_memory_alternative(width, name):
+    # ModRM, SIB and displacement are picked by the Encoding constructor
+    return alternative(f'{width and f"Mem{width}" or "Mem"} {name}', mem=name)
+
+def operand_alternatives(kind, width, name, full_imm):
+    cls = kind.cls
+    if cls == 'xmm' and width == 256:
+        cls = 'ymm'
+    kind_width = kind.width or width
+
+    if kind.role == 'implicit':
+        return [alternative(None)]
+    elif kind.role == 'imm':
+        size = (kind.width or (full_imm and kind_width) or (kind_width == 16 and 16 or 32)) // 8
+        return [alternative(f'IMM{size * 8} {name}', imm=arr(name, size))]
+    elif kind.role == 'rel':
+        size = (kind.width or (kind_width == 16 and 16 or 32)) // 8
+        return [alternative(f'REL{size * 8} {name}', imm=arr(name, size))]
+    elif kind.role == 'opreg':
+        return register_alternatives(cls, kind_width, name, 'opreg', REX_B)
+    elif kind.role == 'mem':
+        return memory_alternatives(64, name) + [runtime_memory_alternative(kind.memory, name)]
+    elif kind.role == 'reg':
+        return register_alternatives(cls, kind_width, name, 'reg', REX_R)
+
+    # register or memory operand encoded in ModRM.rm
+    res = register_alternatives(cls, kind_width, name, 'rm', REX_B, direct=True)
+    if kind.memory:
+        res += memory_alternatives(cls == 'gp' and kind_width or 64, name)
+        res.append(runtime_memory_alternative(kind.memory is True and kind_width or kind.memory, name))
+    return res
+
+def combine(alternatives, szovrd, rex_w, vex):
+    res = Obj()
+    res.args = [alt.arg for alt in alternatives if alt.arg]
+    res.types = tuple(arg.rsplit(' ', 1)[0] for arg in res.args)
+    res.szovrd = szovrd
+    res.reg_in_op = False
+    res.mod_rm = None
+    res.sib = None
+    res.mem = None
+    res.disp = []
+    res.imm = []
+
+    rex = rex_w
+    reg, rm, mod = None, None, None
+    for alt in alternatives:
+        rex |= alt.rex
+        fields = alt.fields
+        reg = fields.get('reg', reg)
+        rm = fields.get('rm', rm)
+        mod = fields.get('mod', mod)
+        res.sib = fields.get('sib', res.sib)
+        res.mem = fields.get('mem', res.mem)
+        res.disp += fields.get('disp', [])
+        res.imm += fields.get('imm', [])
+        res.reg_in_op = res.reg_in_op or 'opreg' in fields
+
+    res.reg = reg
+    if rm is not None:
+        res.mod_rm = mod_rm(mod, reg, rm)
+
+    res.vex = None
+    res.rex = rex
+    if vex is not None:
+        bits = ''.join(bit for bit, mask in [('R', REX_R), ('X', REX_X), ('B', REX_B), ('W', REX_W)] if rex & mask & 0b1111)
+        res.vex = (bits + (vex and 'L' or ''), 'xmm_extra.id')
+        res.args.append(f'{vex and "YMM xmm_extra = YMM0" or "XMM xmm_extra = XMM0"}')
+        res.types += (vex and 'YMM' or 'XMM',)
+        res.rex = 0
+        res.szovrd = False
+
+    return res
+
+# stack operations and indirect branches default to 64-bit operands in long mode,
+# they have no 32-bit form and need no REX.W
+DEFAULT_64 = {'PUSH', 'POP', 'CALL', 'JMP', 'LEAVE'}
+
+def operand_widths(kinds, default_64: bool) -> list:
+    # near branches always use 64-bit operand size, only the 16-bit override is meaningful
+    if any(kind.role == 'rel' for kind in kinds):
+        return [32, 16]
+    return default_64 and [64, 16] or [64, 32, 16]
+
+def operand_roles(kinds, reg_const: bool) -> list[str]:
+    # a lone register takes ModRM.rm when ModRM.reg holds an opcode extension,
+    # the second of two registers without an r/m operand is encoded in ModRM.rm
+    have_rm = any(kind.role in ('rm', 'mem') for kind in kinds)
+    regs = [i for i, kind in enumerate(kinds) if kind.role == 'reg']
+    rm_reg = None
+    if not have_rm and (len(regs) > 1 or (len(regs) == 1 and reg_const)):
+        rm_reg = regs[-1]
+
+    return [i == rm_reg and 'rm' or kind.role for i, kind in enumerate(kinds)]
+
+encoding_forms_cache = {}
+def encoding_forms(signature: str, reg_const: bool, vex: bool, default_64: bool = False) -> list:
+    key = (signature, reg_const, vex, default_64)
+    if key in encoding_forms_cache:
+        return encoding_forms_cache[key]
+
+    kinds = [OPERAND_KINDS[op] for op in (signature and signature.split(',') or [])]
+    sized = any(kind.width is None and kind.role not in ('implicit', 'mem') for kind in kinds)
+    widths = operand_widths(kinds, default_64)
+
+    roles = operand_roles(kinds, reg_const)
+
+    names = []
+    for kind, role in zip(kinds, roles):
+        name = OPERAND_NAMES.get((role, kind.cls), '')
+        names.append(name + (names.count(name) and str(names.count(name) + 1) or ''))
+
+    # only MOV r64, imm64 (B8+r with REX.W) takes a full width immediate
+    full_imm = any(kind.role == 'opreg' for kind in kinds)
+
+    forms = []
+    for width in sized and widths or [kinds and max(kind.width or 0 for kind in kinds) or 0]:
+        # None is the legacy encoding, False and True the VEX.128 and VEX.256 ones
+        for vector in vex and [None, False, True] or [None]:
+            choices = []
+            for i, kind in enumerate(kinds):
+                if roles[i] != kind.role:
+                    kind = operand('rm', kind.cls, kind.width)
+                choices.append(operand_alternatives(kind, vector and 256 or width, names[i], full_imm))
+
+            for alternatives in itertools.product(*choices):
+                # VEX.RXB is inverted, runtime memory operands only go into REX
+                if vector is not None and any('mem' in alt.fields for alt in alternatives):
+                    continue
+                forms.append(combine(alternatives, sized and width == 16, sized and width == 64 and not default_64 and REX_W or 0, vector))
+
+    encoding_forms_cache[key] = forms
+    return forms
+
+# Instruction families, each one is written to its own header in split mode.
+FAMILIES = ['gp', 'x87', 'mmx', 'sse', 'avx', 'system']
+
+def instruction_family(inst, vex = False) -> str:
+    group = inst.ext_grp or ''
+    if vex:
+        return 'avx'
+    elif not inst.pref_0F and 0xD8 <= inst.opcode[0] <= 0xDF:
+        return 'x87'
+    elif group.startswith(('sse', 'ssse')) or any(op.startswith('xmm') for op in inst.ops):
+        return 'sse'
+    elif group == 'mmx' or any(op.startswith('mm') for op in inst.ops):
+        return 'mmx'
+    elif inst.ring_level == '0' or group in ('vmx', 'smx'):
+        return 'system'
+    return 'gp'
+
+def has_vex(inst) -> bool:
+    # SSE forms with a register destination also get their VEX counterpart
+    return bool(inst.pref_0F) and inst.ops[:1] == ['xmm'] and len(inst.ops) == 2 and OPERAND_KINDS.get(inst.ops[1]) is not None and OPERAND_KINDS[inst.ops[1]].cls == 'xmm'
+
+def instruction_families(inst) -> list[str]:
+    return [instruction_family(inst), *(has_vex(inst) and ['avx'] or [])]
+
+def jump(mnemonic: str) -> list[str]:
+    ret = f'Jump<decltype({mnemonic}(REL8{{}}))::SIZE, decltype({mnemonic}(REL32{{}}))::SIZE>'
+    return [
+        '',
+        f'// {mnemonic} label; Short or near form, chosen by Assembler::finalize()',
+        f'static constexpr {ret} {mnemonic}(Label target)' + '{',[
+            f'return {ret}{{{mnemonic}(REL8{{}}), {mnemonic}(REL32{{}}), target.id}};',
+        ], '}'
+    ]
+
+# Rows the immediate dispatch of the ALU instructions is built from.
+ALU_FORMS = ['AL,imm8', 'eAX,imm16/32', 'r/m8,imm8', 'r/m16/32,imm8', 'r/m16/32,imm16/32']
+
+def immediate_dispatch(mnemonic: str, forms: dict) -> list[str]:
+    def dispatch(arg, imm_type, imm, acc = None, short = True):
+        body = []
+        if short:
+            body += ['if(imm >= -128 && imm <= 127){', [f'return {mnemonic}(rm, imm8(imm));'], '}']
+        if acc:
+            body += ['if(rm.id == 0){', [f'return Encoding{{{", ".join(acc)}}}.append({imm}(imm));'], '}']
+        body += [f'return {mnemonic}(rm, {imm}(imm));']
+        return [f'static constexpr Encoding {mnemonic}({arg} rm, {imm_type} imm)' + '{', body, '}']
+
+    res = []
+    if 'r/m16/32,imm8' in forms:
+        acc = forms.get('eAX,imm16/32')
+        for width, imm_type, imm, prefix in [(64, 'int32_t', 'imm32', ['0x48']), (32, 'int32_t', 'imm32', []), (16, 'int16_t', 'imm16', ['0x66'])]:
+            res += ['', f'// {mnemonic} r/m{width}, imm; Sign-extended imm8 or accumulator form whenever it is shorter']
+            res += dispatch(f'Reg{width}', imm_type, imm, acc and prefix + ['0x%02X' % acc.opcode[0]])
+            res += dispatch(f'EReg{width}', imm_type, imm)
+            res += dispatch(f'Mem{width}', imm_type, imm)
+    else:
+        acc = forms['AL,imm8']
+        res += ['', f'// {mnemonic} r/m8, imm; Accumulator form for AL']
+        res += dispatch('Reg8', 'int8_t', 'imm8', ['0x%02X' % acc.opcode[0]], short=False)
+
+    return res
+
 generated = set()
-def generate_instruction(inst) -> list[str]:
+branch_forms = {}
+alu_forms = {}
+def generate_instruction(inst) -> dict[str, list[str]]:
     signature = json.dumps([inst.mnemonic, inst.op1, inst.op2, inst.op3, inst.op4])
     if signature in generated:
-        return []
-        raise Exception(f'// duplicate {signature}')
+        return {}
 
     generated.add(signature)
 
+    # the accumulator forms are only reachable through the immediate dispatch
+    alu_form = ','.join(inst.ops)
+    if alu_form in ALU_FORMS:
+        alu_forms.setdefault(inst.mnemonic, {})[alu_form] = inst
+        if inst.ops[0] in ('AL', 'eAX'):
+            return {}
+
     if inst.reg_in_op:
         for i, arg in enumerate(inst.ops):
             if re.match(r'^r\d', arg):
                 inst.ops[i] = f'#{arg}'
                 break
 
-    def VEX(RXBWL: str, vvvv = None):
-        if not inst.pref_0F:
-            raise Exception("VEX prefix is not expected")
-
-        map_select = '00001'
-        if inst.secondary_opcode == '38':
-            map_select = '00010'
-        elif inst.secondary_opcode == '3A':
-            map_select = '00011'
-
-        pp = '00'
-        if inst.pref == '66':
-            pp = '01'
-        elif inst.pref == 'F3':
-            pp = '10'
-        elif inst.pref == 'F2':
-            pp = '11'
-
-        r, nr = 'R' in RXBWL and (1, 0) or (0, 1)
-        x, nx = 'X' in RXBWL and (1, 0) or (0, 1)
-        b, nb = 'B' in RXBWL and (1, 0) or (0, 1)
-        w, nw = 'W' in RXBWL and (1, 0) or (0, 1)
-        l, nl = 'L' in RXBWL and (1, 0) or (0, 1)
-
-        vvvv = vvvv or '0b1111'
-
-        if [x, b, w, map_select] == [0, 0, 0, '00001']:
-            return [f'0xC5', f'0b{nr}0000000 | (~{vvvv} & 0b1111)<<3 | 0b{l}{pp}']
-        else:
-            return [f'0xC5', int(f'{nr}{nx}{nb}{map_select}', 2), f'0b{w}0000{l}{pp} | ((~{vvvv} & 0b1111) << 3)']
-
-    sib = {'scale': 'rm.scale', 'index': 'rm.index.id', 'base': 'rm.id'}
-    ssesib = {'scale': 'xmmm.scale', 'index': 'xmmm.index.id', 'base': 'xmmm.id'}
-    mmxsib = {'scale': 'mmm.scale', 'index': 'mmm.index.id', 'base': 'mmm.id'}
-
-    generator = {
-    '': lambda: instruction(inst, args=[]),
-    'imm8': lambda: instruction(inst, args=['IMM8 imm'], imm=arr('imm', 1)),
-    'imm16': lambda: instruction(inst, args=['IMM16 imm'], imm=arr('imm', 2)),
-    'r/m8': lambda: [
-        *instruction(inst, args=['RegRm8 rm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id')),
-        *instruction(inst, args=['Reg8 rm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm8 rm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['EReg8 rm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id')),
-    ],
-    'r/m8,r8': lambda: [
-        *instruction(inst, args=['RegRm8 rm', 'Reg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, args=['Reg8 rm', 'Reg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm8 rm', 'Reg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['EReg8 rm', 'Reg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['RegRm8 rm', 'EReg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['Reg8 rm', 'EReg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['ERegRm8 rm', 'EReg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg8 rm', 'EReg8 reg'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-    ],
-    'r/m8,imm8': lambda: [
-        *instruction(inst, args = ['RegRm8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args = ['Reg8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['EReg8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id'), imm=arr('imm', 1)),
-    ],
-    'rel8': lambda: instruction(inst, args=['REL8 rel'], imm=arr('rel', 2)),
-    'rel16/32': lambda: [
-        *instruction(inst, prefix=[SZOVRD], args=['REL16 rel'], imm=arr('rel', 2)),
-        *instruction(inst, args=['REL32 rel'], imm=arr('rel', 4)),
-        *instruction(inst, prefix=[REX_W], args=['REL64 rel'], imm=arr('rel', 8)),
-    ],
-    'r8,r/m8': lambda: [
-        *instruction(inst, args=['Reg8 reg', 'RegRm8 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg8 reg', 'ERegRm8 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg8 reg', 'RegRm8 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg8 reg', 'ERegRm8 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-    ],
-    'r/m8,1': lambda: [
-        *instruction(inst, args=['RegRm8 rm'], mod_rm=mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm8 rm'], mod_rm=mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-    ],
-    'r/m16/32': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['RegRm64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['EReg64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Indir, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp8, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp32, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Indir, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp8, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp32, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Indir, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp8, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp32, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Indir, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp8, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp32, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['RegRm32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['Reg32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['RegRm32Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['RegRm32Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['RegRm32Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['EReg32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, args=['SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp16 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['EReg16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp16 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 2)),
-    ],
-    'r/m16/32,1': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['RegRm64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['EReg64 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Indir, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp8, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp32, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Indir, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp8, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp32, Reg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Indir, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp8, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp32, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Indir, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp8, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp32, EReg64> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['RegRm32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['Reg32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['RegRm32Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, args=['RegRm32Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['RegRm32Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['EReg32 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp32 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, args=['SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b00, inst.reg_const or 0, 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b01, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm = mod_rm(0b10, inst.reg_const or 0, 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['EReg16 rm'], mod_rm = mod_rm(0b11, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Indir rm'], mod_rm = mod_rm(0b00, inst.reg_const or 0, 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, inst.reg_const or 0, 'rm.id'), disp=arr('rm.disp', 2)),
-    ],
-    'r/m16/32,imm8': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['RegRm64 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['EReg64 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['RegRm32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['Reg32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['RegRm32Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['RegRm32Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['RegRm32Disp32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['EReg32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp32 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['SIB<RegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, args=['SIB<RegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['SIB<RegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['EReg16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Indir rm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp8 rm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp16 rm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 1), disp=arr('rm.disp', 2)),
-    ],
-    '#r16/32,imm16/32': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'IMM64 imm'], imm=arr('imm', 8)),
-        *instruction(inst, prefix=[REX_WB], args=['EReg64 reg', 'IMM64 imm'], imm=arr('imm', 8)),
-        *instruction(inst, args=['Reg32 reg', 'IMM32 imm'], imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_B], args=['EReg32 reg', 'IMM32 imm'], imm=arr('imm', 4)),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 reg', 'IMM16 imm'], imm=arr('imm', 2)),
-    ],
-    'r/m16/32,imm16/32': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['RegRm64 rm', 'IMM32 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Indir rm', 'IMM32 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp8 rm', 'IMM32 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['RegRm64Disp32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64 rm', 'IMM32 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Indir rm', 'IMM32 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp8 rm', 'IMM32 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['ERegRm64Disp32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Indir, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp8, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['SIB<RegRm64Disp32, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Indir, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp8, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['SIB<ERegRm64Disp32, Reg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Indir, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp8, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['SIB<RegRm64Disp32, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Indir, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp8, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['SIB<ERegRm64Disp32, EReg64> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['RegRm32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, args=['RegRm32Indir rm', 'IMM32 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, args=['RegRm32Disp8 rm', 'IMM32 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['RegRm32Disp32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Indir rm', 'IMM32 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp8 rm', 'IMM32 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm32Disp32 rm', 'IMM32 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['SIB<RegRm32, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, args=['SIB<RegRm32Indir, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, args=['SIB<RegRm32Disp8, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['SIB<RegRm32Disp32, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Indir, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp8, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm32Disp32, Reg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Indir, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp8, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['SIB<RegRm32Disp32, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b11, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Indir, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b00, inst.reg_const, 0b100), imm=arr('imm', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp8, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b01, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm32Disp32, EReg32> rm', 'IMM32 imm'], sib=sib, mod_rm=mod_rm(0b10, inst.reg_const, 0b100), imm=arr('imm', 4), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16 rm', 'IMM16 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 2)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Indir rm', 'IMM16 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 2)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp8 rm', 'IMM16 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 2), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm16Disp16 rm', 'IMM16 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 2), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16 rm', 'IMM16 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), imm=arr('imm', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Indir rm', 'IMM16 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'rm.id'), imm=arr('imm', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp8 rm', 'IMM16 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'rm.id'), imm=arr('imm', 2), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm16Disp16 rm', 'IMM16 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'rm.id'), imm=arr('imm', 2), disp=arr('rm.disp', 2)),
-    ],
-    'r/m16/32,r16/32': lambda: [
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64 rm', 'Reg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 rm', 'Reg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Indir rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Disp8 rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Disp32 rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64 rm', 'Reg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['EReg64 rm', 'Reg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Indir rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Disp8 rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Disp32 rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64 rm', 'EReg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['Reg64 rm', 'EReg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Indir rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Disp8 rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Disp32 rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64 rm', 'EReg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 rm', 'EReg64 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Indir rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Disp8 rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Disp32 rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], sib=sib, args = ['SIB<RegRm64Indir, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_W], sib=sib, args = ['SIB<RegRm64Disp8, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], sib=sib, args = ['SIB<RegRm64Disp32, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], sib=sib, args = ['SIB<ERegRm64Indir, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WB], sib=sib, args = ['SIB<ERegRm64Disp8, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], sib=sib, args = ['SIB<ERegRm64Disp32, Reg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], sib=sib, args = ['SIB<RegRm64Indir, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WR], sib=sib, args = ['SIB<RegRm64Disp8, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], sib=sib, args = ['SIB<RegRm64Disp32, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], sib=sib, args = ['SIB<ERegRm64Indir, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRB], sib=sib, args = ['SIB<ERegRm64Disp8, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], sib=sib, args = ['SIB<ERegRm64Disp32, Reg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], sib=sib, args = ['SIB<RegRm64Indir, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WX], sib=sib, args = ['SIB<RegRm64Disp8, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], sib=sib, args = ['SIB<RegRm64Disp32, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], sib=sib, args = ['SIB<ERegRm64Indir, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WXB], sib=sib, args = ['SIB<ERegRm64Disp8, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], sib=sib, args = ['SIB<ERegRm64Disp32, EReg64> rm', 'Reg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRX], sib=sib, args = ['SIB<RegRm64Indir, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRX], sib=sib, args = ['SIB<RegRm64Disp8, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRX], sib=sib, args = ['SIB<RegRm64Disp32, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRXB], sib=sib, args = ['SIB<ERegRm64Indir, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRXB], sib=sib, args = ['SIB<ERegRm64Disp8, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRXB], sib=sib, args = ['SIB<ERegRm64Disp32, EReg64> rm', 'EReg64 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args = ['Reg32 rm', 'Reg32 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, args = ['RegRm32Indir rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, args = ['RegRm32Disp8 rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['RegRm32Disp32 rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args = ['EReg32 rm', 'Reg32 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Indir rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Disp8 rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Disp32 rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args = ['Reg32 rm', 'EReg32 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Indir rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Disp8 rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Disp32 rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 rm', 'EReg32 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Indir rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Disp8 rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Disp32 rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        
-        *instruction(inst, prefix=[], sib=sib, args = ['SIB<RegRm32Indir, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[], sib=sib, args = ['SIB<RegRm32Disp8, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[], sib=sib, args = ['SIB<RegRm32Disp32, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], sib=sib, args = ['SIB<ERegRm32Indir, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], sib=sib, args = ['SIB<ERegRm32Disp8, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], sib=sib, args = ['SIB<ERegRm32Disp32, Reg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], sib=sib, args = ['SIB<RegRm32Indir, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], sib=sib, args = ['SIB<RegRm32Disp8, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], sib=sib, args = ['SIB<RegRm32Disp32, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], sib=sib, args = ['SIB<ERegRm32Indir, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], sib=sib, args = ['SIB<ERegRm32Disp8, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], sib=sib, args = ['SIB<ERegRm32Disp32, Reg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], sib=sib, args = ['SIB<RegRm32Indir, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_X], sib=sib, args = ['SIB<RegRm32Disp8, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], sib=sib, args = ['SIB<RegRm32Disp32, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], sib=sib, args = ['SIB<ERegRm32Indir, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], sib=sib, args = ['SIB<ERegRm32Disp8, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], sib=sib, args = ['SIB<ERegRm32Disp32, EReg32> rm', 'Reg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], sib=sib, args = ['SIB<RegRm32Indir, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], sib=sib, args = ['SIB<RegRm32Disp8, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], sib=sib, args = ['SIB<RegRm32Disp32, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], sib=sib, args = ['SIB<ERegRm32Indir, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], sib=sib, args = ['SIB<ERegRm32Disp8, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], sib=sib, args = ['SIB<ERegRm32Disp32, EReg32> rm', 'EReg32 reg'], mod_rm = mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Indir rm', 'Reg16 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Disp8 rm', 'Reg16 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Disp16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['EReg16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Indir rm', 'Reg16 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Disp8 rm', 'Reg16 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Disp16 rm', 'Reg16 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['Reg16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Indir rm', 'EReg16 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Disp8 rm', 'EReg16 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Disp16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Indir rm', 'EReg16 reg'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Disp8 rm', 'EReg16 reg'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Disp16 rm', 'EReg16 reg'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-    ],
-    'r16/32,r/m16/32': lambda: [
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'RegRm64 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'RegRm64Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'RegRm64Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'RegRm64Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'ERegRm64 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'ERegRm64Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'ERegRm64Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'ERegRm64Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'RegRm64 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'RegRm64Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'RegRm64Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'RegRm64Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'ERegRm64 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'ERegRm64Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'ERegRm64Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'ERegRm64Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'SIB<RegRm64, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'SIB<RegRm64Indir, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'SIB<RegRm64Disp8, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args=['Reg64 reg', 'SIB<RegRm64Disp32, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'SIB<ERegRm64, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'SIB<ERegRm64Indir, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'SIB<ERegRm64Disp8, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args=['Reg64 reg', 'SIB<ERegRm64Disp32, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'SIB<RegRm64, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'SIB<RegRm64Indir, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'SIB<RegRm64Disp8, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args=['EReg64 reg', 'SIB<RegRm64Disp32, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'SIB<ERegRm64, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'SIB<ERegRm64Indir, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'SIB<ERegRm64Disp8, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args=['EReg64 reg', 'SIB<ERegRm64Disp32, Reg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args=['Reg64 reg', 'SIB<RegRm64, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WX], args=['Reg64 reg', 'SIB<RegRm64Indir, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WX], args=['Reg64 reg', 'SIB<RegRm64Disp8, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args=['Reg64 reg', 'SIB<RegRm64Disp32, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args=['Reg64 reg', 'SIB<ERegRm64, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WXB], args=['Reg64 reg', 'SIB<ERegRm64Indir, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WXB], args=['Reg64 reg', 'SIB<ERegRm64Disp8, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args=['Reg64 reg', 'SIB<ERegRm64Disp32, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRX], args=['EReg64 reg', 'SIB<RegRm64, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRX], args=['EReg64 reg', 'SIB<RegRm64Indir, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRX], args=['EReg64 reg', 'SIB<RegRm64Disp8, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRX], args=['EReg64 reg', 'SIB<RegRm64Disp32, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRXB], args=['EReg64 reg', 'SIB<ERegRm64, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRXB], args=['EReg64 reg', 'SIB<ERegRm64Indir, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_WRXB], args=['EReg64 reg', 'SIB<ERegRm64Disp8, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRXB], args=['EReg64 reg', 'SIB<ERegRm64Disp32, EReg64> rm'], sib=sib,  mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['Reg32 reg', 'RegRm32 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, args=['Reg32 reg', 'RegRm32Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, args=['Reg32 reg', 'RegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['Reg32 reg', 'RegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm32 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm32Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm32 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm32Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm32 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm32Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['Reg32 reg', 'SIB<RegRm32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, args=['Reg32 reg', 'SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, args=['Reg32 reg', 'SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['Reg32 reg', 'SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['Reg32 reg', 'SIB<RegRm32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_X], args=['Reg32 reg', 'SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_X], args=['Reg32 reg', 'SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['Reg32 reg', 'SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b11, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 reg', 'RegRm16 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 reg', 'RegRm16Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 reg', 'RegRm16Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['Reg16 reg', 'RegRm16Disp16 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg16 reg', 'ERegRm16 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg16 reg', 'ERegRm16Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg16 reg', 'ERegRm16Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg16 reg', 'ERegRm16Disp16 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg16 reg', 'RegRm16 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg16 reg', 'RegRm16Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg16 reg', 'RegRm16Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg16 reg', 'RegRm16Disp16 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg16 reg', 'ERegRm16 rm'], mod_rm=mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg16 reg', 'ERegRm16Indir rm'], mod_rm=mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg16 reg', 'ERegRm16Disp8 rm'], mod_rm=mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg16 reg', 'ERegRm16Disp16 rm'], mod_rm=mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-    ],
-    'r16/32,r/m8': lambda: [
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-
-        *instruction(inst, prefix=[], args = ['Reg32 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[], args = ['Reg32 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-
-
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'Reg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'EReg8 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-    ],
-    'r16/32,r/m16': lambda: [
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-
-        *instruction(inst, args = ['Reg32 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, args = ['Reg32 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'Reg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'EReg16 rm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Indir rm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Disp8 rm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Disp16 rm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), disp=arr('rm.disp', 2)),
-    ],
-    'r/m16/32,r16/32,imm8': lambda: [
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Indir rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Disp8 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['RegRm64Disp32 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['Reg64 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Indir rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Disp8 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['RegRm64Disp32 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['EReg64 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Indir rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Disp8 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['ERegRm64Disp32 rm', 'Reg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Indir rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Disp8 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['ERegRm64Disp32 rm', 'EReg64 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args = ['SIB<RegRm64Indir, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['SIB<RegRm64Disp8, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['SIB<RegRm64Disp32, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args = ['SIB<RegRm64Indir, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['SIB<RegRm64Disp8, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['SIB<RegRm64Disp32, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args = ['SIB<ERegRm64Indir, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['SIB<ERegRm64Disp8, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['SIB<ERegRm64Disp32, Reg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args = ['SIB<ERegRm64Indir, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['SIB<ERegRm64Disp8, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['SIB<ERegRm64Disp32, Reg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args = ['SIB<RegRm64Indir, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WX], args = ['SIB<RegRm64Disp8, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args = ['SIB<RegRm64Disp32, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRX], args = ['SIB<RegRm64Indir, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRX], args = ['SIB<RegRm64Disp8, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRX], args = ['SIB<RegRm64Disp32, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args = ['SIB<ERegRm64Indir, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WXB], args = ['SIB<ERegRm64Disp8, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args = ['SIB<ERegRm64Disp32, EReg64> rm', 'Reg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['SIB<ERegRm64Indir, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['SIB<ERegRm64Disp8, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['SIB<ERegRm64Disp32, EReg64> rm', 'EReg64 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args = ['RegRm32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['Reg32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['RegRm32Indir rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['RegRm32Disp8 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['RegRm32Disp32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['Reg32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Indir rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Disp8 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['RegRm32Disp32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['EReg32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Indir rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Disp8 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['ERegRm32Disp32 rm', 'Reg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Indir rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Disp8 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['ERegRm32Disp32 rm', 'EReg32 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args = ['SIB<RegRm32Indir, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, args = ['SIB<RegRm32Disp8, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['SIB<RegRm32Disp32, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args = ['SIB<RegRm32Indir, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['SIB<RegRm32Disp8, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['SIB<RegRm32Disp32, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args = ['SIB<ERegRm32Indir, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['SIB<ERegRm32Disp8, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['SIB<ERegRm32Disp32, Reg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args = ['SIB<ERegRm32Indir, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['SIB<ERegRm32Disp8, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['SIB<ERegRm32Disp32, Reg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args = ['SIB<RegRm32Indir, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_X], args = ['SIB<RegRm32Disp8, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args = ['SIB<RegRm32Disp32, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args = ['SIB<RegRm32Indir, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RX], args = ['SIB<RegRm32Disp8, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args = ['SIB<RegRm32Disp32, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args = ['SIB<ERegRm32Indir, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_XB], args = ['SIB<ERegRm32Disp8, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args = ['SIB<ERegRm32Disp32, EReg32> rm', 'Reg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args = ['SIB<ERegRm32Indir, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RXB], args = ['SIB<ERegRm32Disp8, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args = ['SIB<ERegRm32Disp32, EReg32> rm', 'EReg32 reg', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Indir rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Disp8 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['RegRm16Disp16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['EReg16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Indir rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Disp8 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['ERegRm16Disp16 rm', 'Reg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['Reg16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Indir rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Disp8 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['RegRm16Disp16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Indir rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Disp8 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['ERegRm16Disp16 rm', 'EReg16 reg', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-    ],
-    'r16/32,r/m16/32,imm8': lambda: [
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm64 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm64Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm64Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'RegRm64Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm64 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm64Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm64Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'ERegRm64Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm64 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm64Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm64Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'RegRm64Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm64 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm64Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm64Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'ERegRm64Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'SIB<RegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'SIB<RegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_W], args = ['Reg64 reg', 'SIB<RegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'SIB<ERegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'SIB<ERegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WB], args = ['Reg64 reg', 'SIB<ERegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'SIB<RegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'SIB<RegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WR], args = ['EReg64 reg', 'SIB<RegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'SIB<ERegRm64Indir, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'SIB<ERegRm64Disp8, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRB], args = ['EReg64 reg', 'SIB<ERegRm64Disp32, Reg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WX], args = ['Reg64 reg', 'SIB<RegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WX], args = ['Reg64 reg', 'SIB<RegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WX], args = ['Reg64 reg', 'SIB<RegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WXB], args = ['Reg64 reg', 'SIB<ERegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WXB], args = ['Reg64 reg', 'SIB<ERegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WXB], args = ['Reg64 reg', 'SIB<ERegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRX], args = ['EReg64 reg', 'SIB<RegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRX], args = ['EReg64 reg', 'SIB<RegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRX], args = ['EReg64 reg', 'SIB<RegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['EReg64 reg', 'SIB<ERegRm64Indir, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['EReg64 reg', 'SIB<ERegRm64Disp8, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_WRXB], args = ['EReg64 reg', 'SIB<ERegRm64Disp32, EReg64> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args = ['Reg32 reg', 'RegRm32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm32Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm32Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'RegRm32Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm32Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm32Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'RegRm32Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm32Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm32Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'ERegRm32Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm32Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm32Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'ERegRm32Disp32 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args = ['Reg32 reg', 'SIB<RegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'SIB<RegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, args = ['Reg32 reg', 'SIB<RegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'SIB<RegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'SIB<RegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args = ['EReg32 reg', 'SIB<RegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'SIB<ERegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'SIB<ERegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args = ['Reg32 reg', 'SIB<ERegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'SIB<ERegRm32Indir, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'SIB<ERegRm32Disp8, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args = ['EReg32 reg', 'SIB<ERegRm32Disp32, Reg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args = ['Reg32 reg', 'SIB<RegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_X], args = ['Reg32 reg', 'SIB<RegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args = ['Reg32 reg', 'SIB<RegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args = ['EReg32 reg', 'SIB<RegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RX], args = ['EReg32 reg', 'SIB<RegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args = ['EReg32 reg', 'SIB<RegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args = ['Reg32 reg', 'SIB<ERegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_XB], args = ['Reg32 reg', 'SIB<ERegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args = ['Reg32 reg', 'SIB<ERegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args = ['EReg32 reg', 'SIB<ERegRm32Indir, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b00, 'reg.id', 0b100), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[REX_RXB], args = ['EReg32 reg', 'SIB<ERegRm32Disp8, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b01, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args = ['EReg32 reg', 'SIB<ERegRm32Disp32, EReg32> rm', 'IMM8 imm'], sib=sib, mod_rm = mod_rm(0b10, 'reg.id', 0b100), imm = arr('imm', 1), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args = ['Reg16 reg', 'RegRm16Disp16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args = ['EReg16 reg', 'RegRm16Disp16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args = ['Reg16 reg', 'ERegRm16Disp16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b11, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Indir rm', 'IMM8 imm'], mod_rm = mod_rm(0b00, 'reg.id', 'rm.id'), imm = arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Disp8 rm', 'IMM8 imm'], mod_rm = mod_rm(0b01, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args = ['EReg16 reg', 'ERegRm16Disp16 rm', 'IMM8 imm'], mod_rm = mod_rm(0b10, 'reg.id', 'rm.id'), imm = arr('imm', 1), disp=arr('rm.disp', 2)),
-    ],
-    'm32': lambda: [
-        *instruction(inst, mod_rm=mod_rm(0b11, inst.reg_const, 'rm.id'), args=['RegRm32 rm']),
-    ],
-    'xmm,r/m32': lambda: [
-        *instruction(inst, args=['XMM xmm', 'RegRm32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, args=['XMM xmm', 'Reg32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm32Indir rm'], mod_rm=mod_rm(0b00, 'xmm.id', 'rm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['XMM xmm', 'RegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'Reg32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm32Indir rm'], mod_rm=mod_rm(0b00, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'EReg32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm32Indir rm'], mod_rm=mod_rm(0b00, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'EReg32 rm'], mod_rm=mod_rm(0b11, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm32Indir rm'], mod_rm=mod_rm(0b00, 'xmm.id', 'rm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm32Disp8 rm'], mod_rm=mod_rm(0b01, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm32Disp32 rm'], mod_rm=mod_rm(0b10, 'xmm.id', 'rm.id'), disp=arr('rm.disp', 4)),
-
-        *instruction(inst, args=['XMM xmm', 'SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, args=['XMM xmm', 'SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, args=['XMM xmm', 'SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_X], args=['XMM xmm', 'SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_X], args=['XMM xmm', 'SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_X], args=['XMM xmm', 'SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('rm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> rm'], sib=sib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('rm.disp', 4)),
-    ],
-    **{k: lambda: [
-        *instruction(inst, args=['XMM xmm', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['XMM xmm', 'XMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'XMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'EXMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'EXMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'XMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'XMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'EXMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'EXMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'YMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'YMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'EYMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'EYMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-    ] for k in ['xmm,xmm/m128', 'xmm,xmm/m64', 'xmm,xmm/m32']},
-    **{k: lambda: [
-        *instruction(inst, args=['XMMM xmmm', 'XMM xmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['RegRm64Indir xmmm', 'XMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['RegRm64Disp8 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['RegRm64Disp32 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['XMMM xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['RegRm64Indir xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['RegRm64Disp8 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['RegRm64Disp32 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['EXMMM xmmm', 'XMM xmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Indir xmmm', 'XMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp8 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp32 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMMM xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['ERegRm64Indir xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['ERegRm64Disp8 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['ERegRm64Disp32 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['SIB<RegRm64Indir, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['SIB<RegRm64Disp8, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['SIB<RegRm64Disp32, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['SIB<ERegRm64Indir, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['SIB<RegRm64Indir, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['SIB<RegRm64Disp8, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['SIB<RegRm64Disp32, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['SIB<ERegRm64Indir, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['RegRm32Indir xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['RegRm32Disp8 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['RegRm32Disp32 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Indir xmmm', 'XMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp8 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp32 xmmm', 'XMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['ERegRm32Indir xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['ERegRm32Disp8 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['ERegRm32Disp32 xmmm', 'EXMM xmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['SIB<RegRm32Indir, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['SIB<RegRm32Disp8, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['SIB<RegRm32Disp32, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['SIB<ERegRm32Indir, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['SIB<RegRm32Indir, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['SIB<RegRm32Disp8, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['SIB<RegRm32Disp32, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['SIB<ERegRm32Indir, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'EXMM xmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMMM xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['RegRm64Indir xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['RegRm64Disp8 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['RegRm64Disp32 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['XMMM xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['RegRm64Indir xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['RegRm64Disp8 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['RegRm64Disp32 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['EXMMM xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['ERegRm64Indir xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['ERegRm64Disp8 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['ERegRm64Disp32 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMMM xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm64Indir xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm64Disp8 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm64Disp32 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm64Indir, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm64Disp8, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm64Disp32, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm64Indir, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm64Disp8, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm64Disp32, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['RegRm32Indir xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['RegRm32Disp8 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['RegRm32Disp32 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['ERegRm32Indir xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['ERegRm32Disp8 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['ERegRm32Disp32 xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm32Indir xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm32Disp8 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['ERegRm32Disp32 xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm32Indir, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm32Disp8, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('R', 'xmm_extra.id'), args=['SIB<RegRm32Disp32, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('B', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm32Indir, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm32Disp8, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RX', 'xmm_extra.id'), args=['SIB<RegRm32Disp32, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('XB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('RXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'EXMM xmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMMM xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['RegRm64Indir xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['RegRm64Disp8 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['RegRm64Disp32 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['YMMM xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['RegRm64Indir xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['RegRm64Disp8 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['RegRm64Disp32 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['EYMMM xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm64Indir xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm64Disp8 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm64Disp32 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMMM xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm64Indir xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm64Disp8 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm64Disp32 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm64Indir, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm64Disp8, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm64Disp32, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, Reg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm64Indir, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm64Disp8, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm64Disp32, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm64Indir, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['RegRm32Indir xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['RegRm32Disp8 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['RegRm32Disp32 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm32Indir xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm32Disp8 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['ERegRm32Disp32 xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm32Indir xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm32Disp8 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['ERegRm32Disp32 xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm32Indir, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm32Disp8, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LR', 'xmm_extra.id'), args=['SIB<RegRm32Disp32, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, Reg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm32Indir, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm32Disp8, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRX', 'xmm_extra.id'), args=['SIB<RegRm32Disp32, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm32Indir, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', prefix=[SZOVRD], vex=VEX('LRXB', 'xmm_extra.id'), args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'EYMM xmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-    ] for k in ['xmm/m128,xmm', 'xmm/m64,xmm', 'xmm/m32,xmm']},
-    'xmm,xmm': lambda: [
-        *instruction(inst, args=['XMM xmm', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['XMM xmm', 'XMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'XMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'EXMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'EXMM xmmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'XMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'XMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'EXMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'EXMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'YMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'YMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'EYMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'EYMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'xmm.id', 'xmmm.id')),
-    ],
-    **{k: lambda: [
-        *instruction(inst, args=['XMM xmm', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['XMM xmm', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'RegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['YMM xmm', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'RegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'xmm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'xmm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<RegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['YMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EYMM xmm', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('xmmm.disp', 4)),
-    
-    ] for k in ['xmm,m64', 'xmm,m32', 'xmm,m16']},
-    **{k: lambda: [
-        *instruction(inst, args=['Reg32 reg', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, args=['Reg32 reg', 'Reg32 xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, args=['Reg32 reg', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, args=['Reg32 reg', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['Reg32 reg', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'Reg32 xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'EReg32 xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'EReg32 xmmm'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EReg32 reg', 'SIB<RegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['Reg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EReg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EReg32 reg', 'SIB<RegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['Reg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EReg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'RegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'RegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'RegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'SIB<RegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'SIB<RegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EReg32 reg', 'SIB<RegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['Reg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EReg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EReg32 reg', 'SIB<RegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EReg32 reg', 'SIB<RegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EReg32 reg', 'SIB<RegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['Reg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EReg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['Reg32 reg', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['Reg32 reg', 'Reg32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'XMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'Reg32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'EReg32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'EXMMM xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'EReg32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Indir xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Disp8 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Disp32 xmmm', 'XMM xmm_extra = XMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('R', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('B', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('XB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('RXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'XMM xmm_extra = XMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['Reg32 reg', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['Reg32 reg', 'Reg32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('L', 'xmm_extra.id'), args=['Reg32 reg', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'YMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'Reg32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'EReg32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'EYMMM xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'EReg32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b11, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm64Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Indir, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp8, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp32, Reg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Indir, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp8, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm64Disp32, EReg64> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'RegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Indir xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b00, 'reg.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Disp8 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b01, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'ERegRm32Disp32 xmmm', 'YMM xmm_extra = YMM0'], mod_rm=mod_rm(0b10, 'reg.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LR', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Indir, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp8, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp32, Reg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRX', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<RegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LXB', 'xmm_extra.id'), args=['Reg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Indir, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b00, 'reg.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp8, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b01, 'reg.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], mnemonic=f'V{inst.mnemonic}', vex=VEX('LRXB', 'xmm_extra.id'), args=['EReg32 reg', 'SIB<ERegRm32Disp32, EReg32> xmmm', 'YMM xmm_extra = YMM0'], sib=ssesib, mod_rm=mod_rm(0b10, 'reg.id', 0b100), disp=arr('xmmm.disp', 4)),
-    ] for k in ['r32,xmm/m64', 'r32,xmm/m32']},
-    **{k: lambda: [
-        *instruction(inst, args=['MM mm', 'XMMM xmmm'], mod_rm=mod_rm(0b11, 'mm.id', 'xmmm.id')),
-        *instruction(inst, args=['MM mm', 'RegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'mm.id', 'xmmm.id')),
-        *instruction(inst, args=['MM mm', 'RegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['MM mm', 'RegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'EXMMM xmmm'], mod_rm=mod_rm(0b11, 'mm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Indir xmmm'], mod_rm=mod_rm(0b00, 'mm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Disp8 xmmm'], mod_rm=mod_rm(0b01, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Disp32 xmmm'], mod_rm=mod_rm(0b10, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Indir, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Disp8, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Disp32, Reg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Indir, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Disp8, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Disp32, EReg64> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Indir xmmm'], mod_rm=mod_rm(0b00, 'mm.id', 'xmmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Disp8 xmmm'], mod_rm=mod_rm(0b01, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Disp32 xmmm'], mod_rm=mod_rm(0b10, 'mm.id', 'xmmm.id'), disp=arr('xmmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Indir, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Disp8, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Disp32, Reg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Indir, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Disp8, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Disp32, EReg32> xmmm'], sib=ssesib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('xmmm.disp', 4)),
-    ] for k in ['mm,xmm/m64', 'mm,xmm/m128']},
-    'xmm,mm/m64': lambda: [
-        *instruction(inst, args=['XMM xmm', 'MMM mmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'mmm.id')),
-        *instruction(inst, args=['XMM xmm', 'MM mmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'mmm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, args=['XMM xmm', 'RegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'MMM mmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'MM mmm'], mod_rm=mod_rm(0b11, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'RegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'ERegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'ERegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Indir, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp8, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_R], args=['EXMM xmm', 'SIB<RegRm64Disp32, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Indir, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp8, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['XMM xmm', 'SIB<ERegRm64Disp32, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Indir, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Indir, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp8, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RX], args=['EXMM xmm', 'SIB<RegRm64Disp32, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Indir, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp8, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['XMM xmm', 'SIB<ERegRm64Disp32, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Indir, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp8, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_RXB], args=['EXMM xmm', 'SIB<ERegRm64Disp32, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'RegRm32Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'ERegRm32Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Indir mmm'], mod_rm=mod_rm(0b00, 'xmm.id', 'mmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp8 mmm'], mod_rm=mod_rm(0b01, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'ERegRm32Disp32 mmm'], mod_rm=mod_rm(0b10, 'xmm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Indir, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp8, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_R], args=['EXMM xmm', 'SIB<RegRm32Disp32, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Indir, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp8, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['XMM xmm', 'SIB<ERegRm32Disp32, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Indir, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Indir, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp8, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RX], args=['EXMM xmm', 'SIB<RegRm32Disp32, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Indir, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp8, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['XMM xmm', 'SIB<ERegRm32Disp32, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Indir, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'xmm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp8, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'xmm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_RXB], args=['EXMM xmm', 'SIB<ERegRm32Disp32, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'xmm.id', 0b100), disp=arr('mmm.disp', 4)),
-    ],
-    'xmm,imm8': lambda: [
-        *instruction(inst, args=['XMMM xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['XMM xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['RegRm64Indir xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, args=['RegRm64Disp8 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['RegRm64Disp32 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, args=['SIB<RegRm64Indir, Reg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1)),
-        *instruction(inst, args=['SIB<RegRm64Disp8, Reg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, args=['SIB<RegRm64Disp32, Reg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_B], args=['EXMMM xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['EXMM xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b11, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Indir xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp8 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp32 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Indir, EReg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp8, EReg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp32, EReg64> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm32Indir xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm32Disp8 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['RegRm32Disp32 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD], args=['SIB<RegRm32Indir, Reg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['SIB<RegRm32Disp8, Reg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD], args=['SIB<RegRm32Disp32, Reg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Indir xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp8 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp32 xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Indir, EReg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b00, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp8, EReg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b01, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp32, EReg32> xmmm', 'IMM8 imm'], mod_rm=mod_rm(0b10, inst.reg_const, 'xmmm.id'), sib=ssesib, imm=arr('imm', 1), disp=arr('xmmm.disp', 4)),
-    ],
-    'mm,mm/m64': lambda: [
-        *instruction(inst, args=['MM mm', 'MMM mmm'], mod_rm=mod_rm(0b11, 'mm.id', 'mmm.id')),
-        *instruction(inst, args=['MM mm', 'MM mmm'], mod_rm=mod_rm(0b11, 'mm.id', 'mmm.id')),
-        *instruction(inst, args=['MM mm', 'RegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, args=['MM mm', 'RegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, args=['MM mm', 'RegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Indir mmm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Disp8 mmm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'ERegRm64Disp32 mmm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Indir, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Disp8, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['MM mm', 'SIB<ERegRm64Disp32, Reg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Indir, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Disp8, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['MM mm', 'SIB<ERegRm64Disp32, EReg64> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Indir mmm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Disp8 mmm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'ERegRm32Disp32 mmm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Indir, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Disp8, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['MM mm', 'SIB<ERegRm32Disp32, Reg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Indir, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Disp8, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['MM mm', 'SIB<ERegRm32Disp32, EReg32> mmm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-    ],
-    'mm/m64,mm': lambda: [
-        *instruction(inst, args=['MMM mmm', 'MM mm'], mod_rm=mod_rm(0b11, 'mm.id', 'mmm.id')),
-        *instruction(inst, args=['RegRm64Indir mmm', 'MM mm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, args=['RegRm64Disp8 mmm', 'MM mm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, args=['RegRm64Disp32 mmm', 'MM mm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Indir mmm', 'MM mm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp8 mmm', 'MM mm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['ERegRm64Disp32 mmm', 'MM mm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Indir, Reg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Disp8, Reg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_B], args=['SIB<ERegRm64Disp32, Reg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Indir, EReg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp8, EReg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[REX_XB], args=['SIB<ERegRm64Disp32, EReg64> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Indir mmm', 'MM mm'], mod_rm=mod_rm(0b00, 'mm.id', 'mmm.id')),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp8 mmm', 'MM mm'], mod_rm=mod_rm(0b01, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['ERegRm32Disp32 mmm', 'MM mm'], mod_rm=mod_rm(0b10, 'mm.id', 'mmm.id'), disp=arr('mmm.disp', 4)),
-
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Indir, Reg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Disp8, Reg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_B], args=['SIB<ERegRm32Disp32, Reg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Indir, EReg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b00, 'mm.id', 0b100)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp8, EReg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b01, 'mm.id', 0b100), disp=arr('mmm.disp', 1)),
-        *instruction(inst, prefix=[SZOVRD, REX_XB], args=['SIB<ERegRm32Disp32, EReg32> mmm', 'MM mm'], sib=mmxsib, mod_rm=mod_rm(0b10, 'mm.id', 0b100), disp=arr('mmm.disp', 4)),
-    ],
-    }
-
-    inst_generator = generator.get(','.join(inst.ops))
-
-    if inst_generator:
-        return inst_generator()
-    else:
+    ops = ','.join(inst.ops)
+    if any(op not in OPERAND_KINDS for op in inst.ops):
         raise Exception(f'TODO {signature}')
 
-def cat(text, ident = '', ident_inc = '    '):
-    if type(text) == list:
-        return ident_inc + (ident).join([cat(t, ident + ident_inc, ident_inc) for t in text])
-    else:
-        return text + '\n'
+    res = {}
+    for form in encoding_forms(ops, type(inst.reg_const) is int, has_vex(inst), inst.mnemonic in DEFAULT_64):
+        prototype = (form.vex and 'V' or '') + inst.mnemonic, form.types
+        if prototype in generated:
+            continue
+        generated.add(prototype)
+        lines = res.setdefault(instruction_family(inst, bool(form.vex)), [])
+        lines += instruction(inst, form)
+
+        # once both displacement sizes exist the Assembler can pick one
+        if form.types in (('REL8',), ('REL32',)):
+            sizes = branch_forms.setdefault(inst.mnemonic, set())
+            sizes.add(form.types[0])
+            if len(sizes) == 2:
+                lines += jump(inst.mnemonic)
+
+    # the dispatch needs the sign-extended imm8 form and the full one
+    forms = alu_forms.get(inst.mnemonic, {})
+    if alu_form in ('r/m16/32,imm8', 'r/m16/32,imm16/32') and 'r/m16/32,imm8' in forms and 'r/m16/32,imm16/32' in forms:
+        res[instruction_family(inst)] += immediate_dispatch(inst.mnemonic, {k: v for k, v in forms.items() if k != 'r/m8,imm8'})
+    elif alu_form == 'r/m8,imm8' and 'AL,imm8' in forms:
+        res[instruction_family(inst)] += immediate_dispatch(inst.mnemonic, {k: v for k, v in forms.items() if k in ('AL,imm8', 'r/m8,imm8')})
+
+    return res
+
+DECODE_PREFIXES = [None, '66', 'F2', 'F3']
+DECODE_MODRM = 0b0001
+DECODE_REG_IN_OPCODE = 0b0010
+DECODE_LOCKABLE = 0b0100
+DECODE_DEFAULT_64 = 0b1000
+
+# Decoded operands are (type, size in bytes, register id). A size of 0 follows
+# the operand size, an immediate of size 8 is as wide as the operand size.
+DECODE_OPERAND_TYPES = [
+    'NONE', 'REG', 'RM', 'OPREG', 'MM', 'MM_RM', 'XMM', 'XMM_RM', 'MEM', 'IMM', 'REL', 'MOFFS',
+    'GP', 'SREG', 'SEG', 'CR', 'DR', 'ST', 'STI', 'ONE',
+]
+
+DECODE_REGISTERS = {
+    **{name: ('GP', 1, i) for i, name in enumerate(['AL', 'CL', 'DL', 'BL', 'AH', 'CH', 'DH', 'BH'])},
+    **{name: ('GP', 2, i) for i, name in enumerate(['AX', 'CX', 'DX', 'BX', 'SP', 'BP', 'SI', 'DI'])},
+    **{name: ('GP', 4, i) for i, name in enumerate(['EAX', 'ECX', 'EDX', 'EBX', 'ESP', 'EBP', 'ESI', 'EDI'])},
+    **{name: ('GP', 0, i) for i, name in enumerate(['eAX', 'eCX', 'eDX', 'eBX', 'eSP', 'eBP', 'eSI', 'eDI'])},
+    **{name: ('GP', 0, i) for i, name in enumerate(['rAX', 'rCX', 'rDX', 'rBX', 'rSP', 'rBP', 'rSI', 'rDI'])},
+    **{name: ('SEG', 0, i) for i, name in enumerate(['ES', 'CS', 'SS', 'DS', 'FS', 'GS'])},
+    'Sreg': ('SREG', 0, 0), 'CRn': ('CR', 0, 0), 'DRn': ('DR', 0, 0),
+    'ST': ('ST', 0, 0), 'ST1': ('ST', 0, 1), 'STi': ('STI', 0, 0), 'ST(i)': ('STI', 0, 0), '1': ('ONE', 0, 0),
+}
+
+DECODE_KINDS = {
+    'r': 'REG', 'r/m': 'RM', 'mm': 'MM', 'mm/m': 'MM_RM', 'xmm': 'XMM', 'xmm/m': 'XMM_RM',
+    'm': 'MEM', 'imm': 'IMM', 'rel': 'REL', 'moffs': 'MOFFS',
+}
+
+def decode_operand(op: str, opreg: bool) -> tuple:
+    # operands the decoder does not know are implicit and left out of the text
+    if op in DECODE_REGISTERS:
+        return DECODE_REGISTERS[op]
+
+    match = re.match(r'^(r/m|r|xmm/m|xmm|mm/m|mm|moffs|m|imm|rel)(\d+)?(/32)?(int|real|dec)?$', op)
+    if not match:
+        return ('NONE', 0, 0)
+
+    kind, bits, opsize, _ = match.groups()
+    kind = kind == 'r' and opreg and 'OPREG' or DECODE_KINDS[kind]
+    size = bits and not opsize and int(bits) // 8 or 0
+    if kind in ('MM', 'XMM'):
+        size = kind == 'MM' and 8 or 16
+    return (kind, size, 0)
+
+def fixed_modrm(inst) -> bool:
+    # the second byte is a fixed ModRM byte (0F 01 C1, D9 E8, ...) and not an 0F 38/0F 3A opcode
+    opcode = inst.opcode
+    return len(opcode) == 2 and opcode[1] >= 0xC0 and not (inst.pref_0F and opcode[0] in (0x38, 0x3A))
+
+def decode_key(inst):
+    if inst.pref not in DECODE_PREFIXES:
+        return None
+
+    prefix = DECODE_PREFIXES.index(inst.pref)
+    opcode = inst.opcode
+    if inst.pref_0F and len(opcode) == 2 and opcode[0] in (0x38, 0x3A):
+        return prefix, opcode[0] == 0x38 and 2 or 3, opcode[1], None
+    elif len(opcode) == 1:
+        return prefix, inst.pref_0F and 1 or 0, opcode[0], None
+    elif fixed_modrm(inst):
+        return prefix, inst.pref_0F and 1 or 0, opcode[0], opcode[1]
+    return None
+
+def decode_entry(inst) -> Obj:
+    entry = Obj()
+    entry.mnemonic = inst.mnemonic
+    entry.ops = [op for op in [inst.op1, inst.op2, inst.op3, inst.op4] if op]
+    entry.flags = (inst.orig.get('Register/Opcode Field') and DECODE_MODRM or 0) \
+        | (inst.reg_in_op and DECODE_REG_IN_OPCODE or 0) \
+        | (inst.lock_fpush_fpop == 'L' and DECODE_LOCKABLE or 0) \
+        | (inst.mnemonic in DEFAULT_64 and DECODE_DEFAULT_64 or 0)
+
+    # the register encoded in the opcode is the first rN operand, as in the encoders
+    opreg = None
+    if inst.reg_in_op:
+        opreg = next((i for i, op in enumerate(entry.ops) if re.match(r'^r\d', op)), None)
+    entry.operands = [decode_operand(op, i == opreg) for i, op in enumerate(entry.ops)]
+    if opreg is not None:
+        # only MOV r64, imm64 (B8+r with REX.W) takes a full width immediate
+        entry.operands = [kind == 'IMM' and not size and (kind, 8, id) or (kind, size, id) for kind, size, id in entry.operands]
+
+    # registers move to ModRM.rm by the same rules as in operand_roles()
+    have_rm = any(kind in ('RM', 'MM_RM', 'XMM_RM', 'MEM') for kind, size, id in entry.operands)
+    regs = [i for i, (kind, size, id) in enumerate(entry.operands) if kind in ('REG', 'MM', 'XMM')]
+    if entry.flags & DECODE_MODRM and not have_rm and (len(regs) > 1 or (len(regs) == 1 and type(inst.reg_const) is int)):
+        kind, size, id = entry.operands[regs[-1]]
+        entry.operands[regs[-1]] = (kind == 'REG' and 'RM' or f'{kind}_RM', size, id)
+    entry.key = (entry.mnemonic, tuple(entry.ops), entry.flags)
+
+    return entry
+
+def decode_tables(insts):
+    # Entries, the slot of every (prefix, map, opcode) and the entries with a
+    # fixed ModRM byte, shared by the C++ and the Python decoder. A slot is an
+    # entry index, the high bit marks 8 entries selected by ModRM.reg.
+    slots = {}
+    fixed = {}
+    for inst in insts:
+        key = decode_key(inst)
+        if not key:
+            continue
+
+        entry = decode_entry(inst)
+        prefix, map, opcode, modrm = key
+        if modrm is not None:
+            fixed.setdefault(key, entry)
+            continue
+
+        for op in range(opcode, opcode + (inst.reg_in_op and 8 or 1)):
+            regs = slots.setdefault((prefix, map, op), [None] * 9)
+            reg = inst.reg_const if type(inst.reg_const) is int else 8
+            regs[reg] = regs[reg] or entry
+
+    entries = [None]
+    single = {}
+    def add(entry) -> int:
+        if entry.key not in single:
+            single[entry.key] = len(entries)
+            entries.append(entry)
+        return single[entry.key]
+
+    index = {}
+    for key, regs in sorted(slots.items()):
+        if any(regs[:8]):
+            index[key] = 0x8000 | len(entries)
+            entries += [regs[reg] or regs[8] for reg in range(8)]
+        else:
+            index[key] = add(regs[8])
+
+    fixed = {key: add(entry) for key, entry in sorted(fixed.items())}
+
+    return entries, index, fixed
+
+def decoded_entry(entry) -> str:
+    if not entry:
+        return 'Decoded{nullptr, nullptr, 0, {}}'
+    operands = ', '.join(f'{{DecodeOperandType::{kind}, {size}, {id}}}' for kind, size, id in entry.operands)
+    return f'Decoded{{{json.dumps(entry.mnemonic)}, {json.dumps(", ".join(entry.ops))}, {entry.flags}, {{{operands}}}}}'
+
+def generate_decode_table(insts) -> list[str]:
+    entries, index, fixed = decode_tables(insts)
 
-print("""#pragma once
+    table = []
+    for prefix in range(4):
+        maps = []
+        for map in range(4):
+            row = [str(index.get((prefix, map, op), 0)) for op in range(256)]
+            maps += ['{', [', '.join(row[i:i + 16]) + ',' for i in range(0, 256, 16)], '},']
+        table += ['{', maps, '},']
 
+    return [
+        '',
+        'enum class MandatoryPrefix: uint8_t{NONE, P66, PF2, PF3};',
+        'enum class OpcodeMap: uint8_t{LEGACY, M0F, M0F38, M0F3A};',
+        '',
+        f'enum class DecodeOperandType: uint8_t{{{", ".join(DECODE_OPERAND_TYPES)}}};',
+        '',
+        '// a size of 0 follows the operand size, an immediate of size 8 is as wide as the operand size',
+        'struct DecodeOperand{',[
+            'DecodeOperandType type;',
+            'uint8_t size;',
+            'uint8_t id;',
+        ], '};',
+        '',
+        'struct Decoded{',[
+            f'static constexpr uint8_t MODRM = {bin(DECODE_MODRM)};',
+            f'static constexpr uint8_t REG_IN_OPCODE = {bin(DECODE_REG_IN_OPCODE)};',
+            f'static constexpr uint8_t LOCKABLE = {bin(DECODE_LOCKABLE)};',
+            f'static constexpr uint8_t DEFAULT_64 = {bin(DECODE_DEFAULT_64)};',
+            'const char *mnemonic;',
+            'const char *operands;',
+            'uint8_t flags;',
+            'DecodeOperand operand[4];',
+        ], '};',
+        '',
+        f'static constexpr Decoded DECODE_ENTRIES[{len(entries)}] = {{',
+            [decoded_entry(entry) + ',' for entry in entries],
+        '};',
+        '',
+        '// index into DECODE_ENTRIES, the high bit marks 8 entries selected by ModRM.reg',
+        'static constexpr uint16_t DECODE_SLOTS[4][4][256] = {', table, '};',
+        '',
+        'struct DecodeFixed{',[
+            'uint8_t prefix;',
+            'uint8_t map;',
+            'uint8_t opcode;',
+            'uint8_t modrm;',
+            'uint16_t entry;',
+        ], '};',
+        '',
+        '// opcodes with a fixed ModRM byte, terminated by entry 0',
+        f'static constexpr DecodeFixed DECODE_FIXED[{len(fixed) + 1}] = {{',
+            [f'{{{prefix}, {map}, 0x{opcode:02X}, 0x{modrm:02X}, {entry}}},' for (prefix, map, opcode, modrm), entry in fixed.items()],
+            ['{0, 0, 0, 0, 0},'],
+        '};',
+        '',
+        '// returns nullptr for unknown opcodes, prefixed lookups fall back to the unprefixed form',
+        'static constexpr const Decoded *decode(MandatoryPrefix prefix, OpcodeMap map, uint8_t opcode, uint8_t reg = 0){',[
+            'uint16_t slot = DECODE_SLOTS[static_cast<uint8_t>(prefix) & 3][static_cast<uint8_t>(map) & 3][opcode];',
+            'if(slot == 0){',[
+                'slot = DECODE_SLOTS[0][static_cast<uint8_t>(map) & 3][opcode];',
+            ], '}',
+            'const Decoded *entry = &DECODE_ENTRIES[(slot & 0x7FFF) + (slot >> 15) * (reg & 0b111)];',
+            'return entry->mnemonic ? entry : nullptr;',
+        ], '}',
+    ]
+
+BATCH_MODRM = 0b001
+BATCH_REG_OPERAND = 0b010
+BATCH_OPCODE_REG = 0b100
+# the ModRM.reg or the ModRM.rm/opcode register operand is a byte register,
+# ids 4-7 are AH-BH there and can not be combined with a REX prefix
+BATCH_BYTE_REG = 0b01000
+BATCH_BYTE_RM = 0b10000
+
+def batch_forms(insts) -> list[Obj]:
+    forms = {}
+    for inst in insts:
+        ops = [op.lstrip('#') for op in inst.ops]
+        if any(op not in OPERAND_KINDS for op in ops):
+            continue
+        kinds = [OPERAND_KINDS[op] for op in ops]
+        if inst.reg_in_op:
+            kinds = [kind.role == 'reg' and operand('opreg', kind.cls, kind.width) or kind for kind in kinds]
+        roles = operand_roles(kinds, type(inst.reg_const) is int)
+        # branches go through labels, the descriptor holds two operands and one immediate
+        if 'rel' in roles or roles.count('imm') > 1 or len([r for r in roles if r not in ('imm', 'implicit')]) > 2:
+            continue
+
+        sized = any(kind.width is None and kind.role not in ('implicit', 'mem') for kind in kinds)
+        default_64 = inst.mnemonic in DEFAULT_64
+        for width in sized and operand_widths(kinds, default_64) or [None]:
+            tokens = []
+            for op, kind in zip(ops, kinds):
+                if kind.role == 'imm':
+                    size = kind.width or (width == 16 and 16 or ('opreg' in roles and width or 32))
+                    tokens.append(f'I{size}')
+                else:
+                    tokens.append(op.replace('16/32', str(width)).replace('/', '').upper())
+            name = '_'.join([inst.mnemonic, *tokens])
+            if name in forms:
+                continue
+
+            form = forms[name] = Obj()
+            form.name = name
+            form.prefixes = [*(sized and width == 16 and inst.pref != '66' and [SZOVRD] or []), *(inst.pref and [int(inst.pref, 16)] or [])]
+            form.rex = sized and width == 64 and not default_64 and REX_W or 0
+            form.opcode = [*(inst.pref_0F and [int(inst.pref_0F, 16)] or []), *inst.opcode]
+
+            slots = {}
+            for i, role in enumerate(roles):
+                if role not in ('imm', 'implicit'):
+                    slots[role] = len(slots)
+            # a fixed ModRM byte is already part of the opcode
+            form.flags = not fixed_modrm(inst) and ('reg' in slots or 'rm' in slots or 'mem' in slots or type(inst.reg_const) is int) and BATCH_MODRM or 0
+            form.reg = inst.reg_const or 0
+            if 'reg' in slots:
+                form.flags |= BATCH_REG_OPERAND
+                form.reg = slots['reg']
+            form.rm = slots.get('rm', slots.get('mem', 0))
+            if 'opreg' in slots:
+                form.flags |= BATCH_OPCODE_REG
+                form.rm = slots['opreg']
+            byte_roles = {role for token, role in zip(tokens, roles) if token in ('R8', 'RM8')}
+            form.flags |= ('reg' in byte_roles and BATCH_BYTE_REG or 0) | (byte_roles & {'rm', 'opreg'} and BATCH_BYTE_RM or 0)
+            form.imm = sum(int(token[1:]) // 8 for token, role in zip(tokens, roles) if role == 'imm')
+            # (role, token, memory allowed) of every explicit operand
+            form.operands = [
+                (role, token, kind.role in ('rm', 'mem') and role in ('rm', 'mem'))
+                for token, kind, role in zip(tokens, kinds, roles) if role != 'implicit'
+            ]
+
+    return list(forms.values())
+
+def batch_form(form) -> str:
+    prefixes = ['0x%02X' % b for b in form.prefixes]
+    opcode = ['0x%02X' % b for b in form.opcode]
+    fields = [
+        '{' + ', '.join(prefixes + ['0'] * (2 - len(prefixes))) + '}', len(prefixes), '0x%02X' % form.rex,
+        '{' + ', '.join(opcode + ['0'] * (3 - len(opcode))) + '}', len(opcode),
+        form.reg, form.rm, form.flags, form.imm,
+    ]
+    return '{' + ', '.join(str(field) for field in fields) + '}'
+
+def generate_batch_table(insts) -> list[str]:
+    forms = batch_forms(insts)
+
+    return [
+        '',
+        'enum class BatchOp: uint16_t{',
+            [f'{form.name},' for form in forms],
+        '};',
+        '',
+        'struct BatchForm{',[
+            f'static constexpr uint8_t MODRM = {bin(BATCH_MODRM)};',
+            f'static constexpr uint8_t REG_OPERAND = {bin(BATCH_REG_OPERAND)};',
+            f'static constexpr uint8_t OPCODE_REG = {bin(BATCH_OPCODE_REG)};',
+            f'static constexpr uint8_t BYTE_REG = {bin(BATCH_BYTE_REG)};',
+            f'static constexpr uint8_t BYTE_RM = {bin(BATCH_BYTE_RM)};',
+            'uint8_t prefixes[2];',
+            'uint8_t prefix_count;',
+            'uint8_t rex;',
+            'uint8_t opcode[3];',
+            'uint8_t opcode_size;',
+            '// operand slot for ModRM.reg with REG_OPERAND, the opcode extension otherwise',
+            'uint8_t reg;',
+            '// operand slot for ModRM.rm, or added to the opcode with OPCODE_REG',
+            'uint8_t rm;',
+            'uint8_t flags;',
+            'uint8_t imm_size;',
+        ], '};',
+        '',
+        f'static constexpr BatchForm BATCH_FORMS[{len(forms)}] = {{',
+            [f'{batch_form(form)}, // {form.name}' for form in forms],
+        '};',
+        '',
+        'struct BatchOperand{',[
+            'static constexpr uint8_t NONE = 0;',
+            'static constexpr uint8_t REG = 1;',
+            'static constexpr uint8_t MEM = 2;',
+            '',
+            'uint8_t kind = NONE;',
+            'uint8_t id = 0;',
+            'uint8_t index = Mem::NO_INDEX;',
+            'uint8_t scale = 0;',
+            'int32_t disp = 0;',
+            '',
+            'constexpr BatchOperand() = default;',
+            '',
+            'template <RegisterType REGISTER_TYPE, size_t REGISTER_SIZE, bool REGISTER_EXT>',
+            'constexpr BatchOperand(Register<REGISTER_TYPE, RegisterMod::NONE, REGISTER_SIZE, REGISTER_EXT> reg)',
+            '    : kind(REG), id(REGISTER_EXT << 3 | reg.id){}',
+            '',
+            'template <size_t MEMORY_SIZE>',
+            'constexpr BatchOperand(const Memory<MEMORY_SIZE> &mem)',
+            '    : kind(MEM), id(mem.base), index(mem.index), scale(mem.scale), disp(mem.disp){}',
+        ], '};',
+        '',
+        'struct BatchInstruction{',[
+            'BatchOp op;',
+            'BatchOperand operands[2];',
+            'int64_t imm = 0;',
+        ], '};',
+        '',
+        '// Encodes count instructions into out, which needs room for 15 bytes per',
+        '// instruction, and returns the number of bytes written. Byte register ids',
+        '// 4-7 are AH-BH as in the typed API, combining them with an operand that',
+        '// needs REX throws std::invalid_argument.',
+        'inline size_t encode(const BatchInstruction *insts, size_t count, uint8_t *out){',[
+            'uint8_t *begin = out;',
+            'for(const BatchInstruction *inst = insts; inst != insts + count; inst++){',[
+                'const BatchForm &form = BATCH_FORMS[static_cast<uint16_t>(inst->op)];',
+                'const BatchOperand &rm = inst->operands[form.rm];',
+                'uint8_t reg = form.flags & BatchForm::REG_OPERAND ? inst->operands[form.reg].id : form.reg;',
+                '',
+                'for(uint8_t i = 0; i < form.prefix_count; i++){',[
+                    '*out++ = form.prefixes[i];',
+                ], '}',
+                'uint8_t rex = form.rex | (reg >> 3) << 2;',
+                'rex |= rm.kind == BatchOperand::MEM ? memory_rex(rm.id, rm.index) : rm.id >> 3;',
+                'bool high_byte = (form.flags & BatchForm::BYTE_REG && reg >> 2 == 1)',
+                '    || (form.flags & BatchForm::BYTE_RM && rm.kind == BatchOperand::REG && rm.id >> 2 == 1);',
+                'if(rex && high_byte){',[
+                    'throw std::invalid_argument("x86::encode: AH, CH, DH and BH can not be encoded with a REX prefix");',
+                ], '}',
+                'if(rex){',[
+                    '*out++ = 0x40 | rex;',
+                ], '}',
+                'std::memcpy(out, form.opcode, 3);',
+                'out += form.opcode_size;',
+                'if(form.flags & BatchForm::OPCODE_REG){',[
+                    'out[-1] += rm.id & 0b111;',
+                ], '}',
+                'if(form.flags & BatchForm::MODRM){',[
+                    'if(rm.kind == BatchOperand::MEM){',[
+                        'out = memory_operand(out, reg, rm.id, rm.index, rm.scale, rm.disp);',
+                    ], '}else{',[
+                        '*out++ = mod_rm(0b11, reg, rm.id);',
+                    ], '}',
+                ], '}',
+                'for(uint8_t i = 0; i < form.imm_size; i++){',[
+                    '*out++ = static_cast<uint8_t>(static_cast<uint64_t>(inst->imm) >> (i * 8));',
+                ], '}',
+            ], '}',
+            'return out - begin;',
+        ], '}',
+        '',
+        'inline Assembler &encode(Assembler &assembler, const BatchInstruction *insts, size_t count){',[
+            'size_t size = assembler.size();',
+            'assembler.resize(size + encode(insts, count, assembler.append(15 * count)));',
+            'return assembler;',
+        ], '}',
+    ]
+
+def runtime_encoder(form, memory: bool) -> list[str]:
+    params, rex, high = ['uint8_t *out'], [], []
+    if form.rex:
+        rex.append(bin(form.rex & 0b1111))
+    for role, token, _ in form.operands:
+        if role == 'imm':
+            params.append('int64_t imm')
+        elif role in ('rm', 'mem') and memory:
+            params.append('const Address &mem')
+            rex.append('address_rex(mem)')
+        elif role == 'rm':
+            params.append('RegId rm')
+            rex.append('rm >> 3')
+        else:
+            params.append('RegId reg')
+            rex.append(role == 'reg' and '(reg >> 3) << 2' or 'reg >> 3')
+        if token in ('R8', 'RM8') and not (role == 'rm' and memory):
+            high.append(f'high_byte({params[-1].split()[-1]})')
+
+    body = [f'*out++ = 0x{b:02X};' for b in form.prefixes]
+    if len(rex) > bool(form.rex):
+        if high:
+            body.append(f'check_high_byte({" | ".join(rex)}, {" | ".join(high)});')
+        body.append(f'out = rex(out, {" | ".join(rex)});')
+    elif form.rex:
+        body.append(f'*out++ = 0x{form.rex:02X};')
+    body += [f'*out++ = 0x{b:02X};' for b in form.opcode[:-1]]
+    body.append(f'*out++ = 0x{form.opcode[-1]:02X}' + (form.flags & BATCH_OPCODE_REG and ' + (reg & 0b111);' or ';'))
+    if form.flags & BATCH_MODRM:
+        reg = form.flags & BATCH_REG_OPERAND and 'reg' or str(form.reg)
+        rm = 'RegId rm' in params and 'rm' or '0'
+        body.append(memory and f'out = address(out, {reg}, mem);' or f'*out++ = mod_rm(0b11, {reg}, {rm});')
+    if form.imm:
+        body.append(f'out = immediate<{form.imm}>(out, imm);')
+
+    return [
+        f'constexpr uint8_t *{form.name}({", ".join(params)}){{', [
+            *body,
+            'return out;',
+        ], '}',
+    ]
+
+def generate_runtime_encoders(insts) -> list[str]:
+    lines = []
+    for form in batch_forms(insts):
+        # r/m operands get a register and a memory overload, m operands only the latter
+        rm = [(role, memory) for role, _, memory in form.operands if role in ('rm', 'mem')]
+        if not rm or rm[0][0] == 'rm':
+            lines += [''] + runtime_encoder(form, False)
+        if rm and rm[0][1]:
+            lines += [''] + runtime_encoder(form, True)
+
+    return ['namespace runtime{', '', RUNTIME.strip('\n'), *lines, '', '}']
+
+class Emitter:
+    """Collects the generated lines and writes them out with a single write.
+
+    Nested lists are indented one level deeper than their parent, they are
+    walked with an explicit stack so the cost is linear in the output size.
+    """
+    def __init__(self, file, indent = '    '):
+        self.file = file
+        self.indent = indent
+        self.chunks = []
+
+    def raw(self, text: str):
+        self.chunks.append(text)
+
+    def lines(self, lines: list, depth = 0):
+        stack = [iter(lines)]
+        while stack:
+            for line in stack[-1]:
+                if type(line) == list:
+                    stack.append(iter(line))
+                    break
+                self.chunks.append(line and self.indent * (len(stack) - 1 + depth) + line + '\n' or '\n')
+            else:
+                stack.pop()
+
+    def text(self) -> str:
+        text = ''.join(self.chunks)
+        self.chunks = []
+        return text
+
+    def close(self):
+        self.file.write(self.text())
+        self.file.flush()
+
+HEADER = """#pragma once
+
+#include <algorithm>
 #include <array>
+#include <cstddef>
 #include <cstdint>
+#include <cstring>
+#include <initializer_list>
+#include <memory>
+#include <stdexcept>
 #include <type_traits>
+#include <utility>
+#include <vector>
 
 #define U8(BYTE) static_cast<uint8_t>(BYTE)
 
@@ -2136,7 +1079,29 @@ namespace{
 typedef uint8_t RegId;
 
 template <size_t INSTRUCTION_SIZE, bool LOCKABLE>
-struct Instruction: std::array<uint8_t, INSTRUCTION_SIZE>{};
+struct Instruction: std::array<uint8_t, INSTRUCTION_SIZE>{
+    static constexpr size_t SIZE = INSTRUCTION_SIZE;
+};
+
+// Encoding with a zero displacement in its last REL_SIZE bytes.
+template <size_t INSTRUCTION_SIZE, size_t REL_SIZE>
+struct Branch{
+    static constexpr size_t SIZE = INSTRUCTION_SIZE;
+
+    Instruction<INSTRUCTION_SIZE, false> inst;
+    uint32_t label;
+};
+
+// Branch with both displacement sizes, the Assembler picks the short one
+// whenever the target is in reach.
+template <size_t SHORT_SIZE, size_t NEAR_SIZE>
+struct Jump{
+    static constexpr size_t SIZE = SHORT_SIZE;
+
+    Instruction<SHORT_SIZE, false> short_form;
+    Instruction<NEAR_SIZE, false> near_form;
+    uint32_t label;
+};
 
 static constexpr uint8_t mod_rm(uint8_t mod, uint8_t reg, uint8_t rm){
     return (mod & 0b11) << 6 | (reg & 0b111) << 3 | (rm & 0b111);
@@ -2514,13 +1479,1631 @@ constexpr IMM64 imm64(uint64_t val){
     };
 }
 
+struct Label{
+    uint32_t id;
+};
+
+// Branch target whose displacement is patched in later by the Assembler.
+template <size_t REL_SIZE>
+struct LabelRef{
+    uint32_t id;
+};
+
+constexpr LabelRef<1> rel8(Label label){
+    return LabelRef<1>{label.id};
+}
+
+constexpr LabelRef<4> rel32(Label label){
+    return LabelRef<4>{label.id};
+}
+
+// Memory operand of MEMORY_SIZE bits (0 if implied by the instruction),
+// addressed by a 64-bit base, an optional scaled index and a displacement.
+template <size_t MEMORY_SIZE>
+struct Memory{
+    static constexpr uint8_t NO_INDEX = 0xFF;
+
+    uint8_t base;
+    uint8_t index = NO_INDEX;
+    uint8_t scale = 0;
+    int32_t disp = 0;
+
+    template <bool BASE_EXT>
+    explicit constexpr Memory(Register<RegisterType::GP, RegisterMod::NONE, 64, BASE_EXT> base_reg, int32_t disp = 0)
+        : base(BASE_EXT << 3 | base_reg.id), disp(disp){}
+
+    template <bool BASE_EXT, bool INDEX_EXT>
+    explicit constexpr Memory(Register<RegisterType::GP, RegisterMod::NONE, 64, BASE_EXT> base_reg,
+                     Register<RegisterType::GP, RegisterMod::NONE, 64, INDEX_EXT> index_reg, uint8_t scale_factor, int32_t disp = 0)
+        : base(BASE_EXT << 3 | base_reg.id), index(INDEX_EXT << 3 | index_reg.id), disp(disp){
+        if(index == 0b100){
+            throw std::invalid_argument("x86::Memory: RSP cannot be an index register");
+        }
+        if(scale_factor != 1 && scale_factor != 2 && scale_factor != 4 && scale_factor != 8){
+            throw std::invalid_argument("x86::Memory: scale must be 1, 2, 4 or 8");
+        }
+        scale = scale_factor == 8 ? 3 : scale_factor == 4 ? 2 : scale_factor == 2 ? 1 : 0;
+    }
+};
+
+using Mem = Memory<0>;
+using Mem8 = Memory<8>;
+using Mem16 = Memory<16>;
+using Mem32 = Memory<32>;
+using Mem64 = Memory<64>;
+using Mem80 = Memory<80>;
+using Mem128 = Memory<128>;
+
+// REX.X and REX.B of a memory operand.
+constexpr uint8_t memory_rex(uint8_t base, uint8_t index){
+    return (base >> 3) | (index != Mem::NO_INDEX ? (index >> 3) << 1 : 0);
+}
+
+// Writes ModRM, SIB and the shortest displacement of a memory operand.
+// RBP/R13 as base always take a displacement, RSP/R12 a SIB byte.
+constexpr uint8_t *memory_operand(uint8_t *out, uint8_t reg, uint8_t base, uint8_t index, uint8_t scale, int32_t disp){
+    bool have_index = index != Mem::NO_INDEX;
+    bool have_sib = have_index || (base & 0b111) == 0b100;
+    uint8_t mod = 0b10;
+    if(disp == 0 && (base & 0b111) != 0b101){
+        mod = 0b00;
+    }else if(disp >= -128 && disp <= 127){
+        mod = 0b01;
+    }
+    *out++ = mod_rm(mod, reg, have_sib ? 0b100 : base);
+    if(have_sib){
+        *out++ = sib(scale, have_index ? index : 0b100, base);
+    }
+    for(int i = 0; i < (mod == 0b01 ? 1 : mod == 0b10 ? 4 : 0); i++){
+        *out++ = static_cast<uint8_t>(static_cast<uint32_t>(disp) >> (i * 8));
+    }
+    return out;
+}
+
+// Instruction whose length is only known at run time.
+struct Encoding{
+    std::array<uint8_t, 15> bytes{};
+    uint8_t size = 0;
+
+    constexpr Encoding() = default;
+
+    constexpr Encoding(std::initializer_list<uint8_t> bytes){
+        append(bytes);
+    }
+
+    template <size_t INSTRUCTION_SIZE, bool LOCKABLE>
+    constexpr Encoding(const Instruction<INSTRUCTION_SIZE, LOCKABLE> &inst){
+        append(inst);
+    }
+
+    // Emits REX only when an operand needs it and the shortest ModRM/SIB/disp
+    // for mem.
+    template <size_t MEMORY_SIZE>
+    constexpr Encoding(std::initializer_list<uint8_t> prefixes, uint8_t rex, std::initializer_list<uint8_t> opcode,
+                       uint8_t reg, const Memory<MEMORY_SIZE> &mem, std::initializer_list<uint8_t> imm){
+        append(prefixes);
+        rex |= memory_rex(mem.base, mem.index);
+        if(rex){
+            push(0x40 | rex);
+        }
+        append(opcode);
+        size = memory_operand(bytes.data() + size, reg, mem.base, mem.index, mem.scale, mem.disp) - bytes.data();
+        append(imm);
+    }
+
+    constexpr void push(uint8_t byte){
+        bytes[size++] = byte;
+    }
+
+    constexpr Encoding &append(std::initializer_list<uint8_t> list){
+        for(uint8_t byte: list){
+            push(byte);
+        }
+        return *this;
+    }
+
+    template <size_t SIZE>
+    constexpr Encoding &append(const std::array<uint8_t, SIZE> &list){
+        for(uint8_t byte: list){
+            push(byte);
+        }
+        return *this;
+    }
+};
+
+
+"""
+
+ASSEMBLER = """
+// Code buffer the encoders append to in place. It either owns a growable
+// buffer or writes into a caller-provided one of fixed capacity.
+class Assembler{
+public:
+    explicit Assembler(size_t capacity = 4096){
+        reserve(capacity);
+    }
 
-""")
+    Assembler(uint8_t *buffer, size_t capacity): buffer_(buffer), capacity_(capacity){}
 
-for inst in insts:
+    Assembler(const Assembler &) = delete;
+    Assembler &operator=(const Assembler &) = delete;
+
+    uint8_t *data(){ return buffer_; }
+    const uint8_t *data() const{ return buffer_; }
+    size_t size() const{ return size_; }
+    size_t capacity() const{ return capacity_; }
+
+    void clear(){
+        size_ = 0;
+        labels_.clear();
+        fixups_.clear();
+        jumps_.clear();
+    }
+
+    void reserve(size_t capacity){
+        if(capacity <= capacity_){
+            return;
+        }
+        if(buffer_ && !storage_){
+            throw std::length_error("x86::Assembler: caller-provided buffer is full");
+        }
+        auto storage = std::make_unique_for_overwrite<uint8_t[]>(capacity);
+        if(size_){
+            std::memcpy(storage.get(), buffer_, size_);
+        }
+        storage_ = std::move(storage);
+        buffer_ = storage_.get();
+        capacity_ = capacity;
+    }
+
+    // Sets the code size, e.g. after writing fewer bytes than append() claimed.
+    void resize(size_t size){
+        reserve(size);
+        size_ = size;
+    }
+
+    // Claims count bytes at the end of the buffer and returns them.
+    uint8_t *append(size_t count){
+        if(capacity_ - size_ < count){
+            reserve(std::max(capacity_ * 2, size_ + count));
+        }
+        uint8_t *res = buffer_ + size_;
+        size_ += count;
+        return res;
+    }
+
+    Label label(){
+        labels_.push_back(UNBOUND);
+        return Label{static_cast<uint32_t>(labels_.size() - 1)};
+    }
+
+    // Binds label to the current end of the code.
+    void bind(Label label){
+        labels_[label.id] = size_;
+    }
+
+    // Appends any number of instructions and branches with a single capacity
+    // check, every copy but the ones of an Encoding has a compile-time size.
+    template <typename... INSTRUCTIONS>
+    Assembler &emit(const INSTRUCTIONS &...insts){
+        size_t pos = append((encoded_size(insts) + ... + 0)) - buffer_;
+        (put(pos, insts), ...);
+        return *this;
+    }
+
+    // Picks the size of every Jump, then writes the displacements of all
+    // branches to their bound labels. Offsets of code emitted before are only
+    // final after this.
+    void finalize(){
+        if(!jumps_.empty()){
+            relax();
+        }
+        for(const Fixup &fixup: fixups_){
+            size_t target = labels_[fixup.label];
+            if(target == UNBOUND){
+                throw std::logic_error("x86::Assembler: branch to an unbound label");
+            }
+            int64_t disp = static_cast<int64_t>(target) - static_cast<int64_t>(fixup.end);
+            int64_t limit = int64_t{1} << (fixup.size * 8 - 1);
+            if(disp < -limit || disp >= limit){
+                throw std::range_error("x86::Assembler: branch displacement out of range");
+            }
+            for(size_t i = 0; i < fixup.size; i++){
+                buffer_[fixup.end - fixup.size + i] = static_cast<uint8_t>(static_cast<uint64_t>(disp) >> (i * 8));
+            }
+        }
+    }
+
+    // Relaxation passes before the remaining short jumps are made near.
+    static constexpr size_t MAX_RELAX_PASSES = 16;
+
+private:
+    static constexpr size_t UNBOUND = SIZE_MAX;
+
+    struct Fixup{
+        size_t end;
+        uint32_t label;
+        uint8_t size;
+    };
+
+    struct JumpSite{
+        size_t offset;
+        uint32_t label;
+        uint8_t short_size;
+        uint8_t near_size;
+        std::array<uint8_t, 8> near_form;
+    };
+
+    // Growth of all jumps that start before offset.
+    size_t shift(const std::vector<size_t> &growth, size_t offset) const{
+        auto it = std::lower_bound(jumps_.begin(), jumps_.end(), offset, [](const JumpSite &jump, size_t offset){
+            return jump.offset < offset;
+        });
+        return growth[it - jumps_.begin()];
+    }
+
+    // Every jump starts short and only ever grows, so the passes converge.
+    // Nothing is changed until everything that can throw has been done.
+    void relax(){
+        for(const JumpSite &jump: jumps_){
+            if(labels_[jump.label] == UNBOUND){
+                throw std::logic_error("x86::Assembler: branch to an unbound label");
+            }
+        }
+
+        std::vector<bool> near(jumps_.size());
+        std::vector<size_t> growth(jumps_.size() + 1);
+        bool changed = true;
+        for(size_t pass = 0; changed; pass++){
+            changed = false;
+            for(size_t i = 0; i < jumps_.size(); i++){
+                growth[i + 1] = growth[i] + (near[i] ? jumps_[i].near_size - jumps_[i].short_size : 0);
+            }
+            for(size_t i = 0; i < jumps_.size(); i++){
+                if(near[i]){
+                    continue;
+                }
+                size_t target = labels_[jumps_[i].label];
+                size_t end = jumps_[i].offset + jumps_[i].short_size;
+                int64_t disp = static_cast<int64_t>(target + shift(growth, target)) - static_cast<int64_t>(end + shift(growth, end));
+                if(disp < -128 || disp > 127 || pass == MAX_RELAX_PASSES){
+                    near[i] = true;
+                    changed = true;
+                }
+            }
+        }
+
+        std::vector<Fixup> fixups;
+        fixups.reserve(fixups_.size() + jumps_.size());
+        for(const Fixup &fixup: fixups_){
+            fixups.push_back(Fixup{fixup.end + shift(growth, fixup.end), fixup.label, fixup.size});
+        }
+        std::vector<size_t> labels(labels_);
+        for(size_t &label: labels){
+            if(label != UNBOUND){
+                label += shift(growth, label);
+            }
+        }
+
+        std::vector<uint8_t> code(buffer_, buffer_ + size_);
+        reserve(size_ + growth.back());
+
+        size_t src = 0, dst = 0;
+        for(size_t i = 0; i < jumps_.size(); i++){
+            const JumpSite &jump = jumps_[i];
+            std::memcpy(buffer_ + dst, code.data() + src, jump.offset - src);
+            dst += jump.offset - src;
+            if(near[i]){
+                std::memcpy(buffer_ + dst, jump.near_form.data(), jump.near_size);
+                dst += jump.near_size;
+                fixups.push_back(Fixup{dst, jump.label, 4});
+            }else{
+                std::memcpy(buffer_ + dst, code.data() + jump.offset, jump.short_size);
+                dst += jump.short_size;
+                fixups.push_back(Fixup{dst, jump.label, 1});
+            }
+            src = jump.offset + jump.short_size;
+        }
+        std::memcpy(buffer_ + dst, code.data() + src, size_ - src);
+        size_ = dst + size_ - src;
+        fixups_.swap(fixups);
+        labels_.swap(labels);
+        jumps_.clear();
+    }
+
+    template <typename INSTRUCTION>
+    static constexpr size_t encoded_size(const INSTRUCTION &inst){
+        if constexpr(std::is_same_v<INSTRUCTION, Encoding>){
+            return inst.size;
+        }else{
+            return INSTRUCTION::SIZE;
+        }
+    }
+
+    void put(size_t &pos, const Encoding &inst){
+        std::memcpy(buffer_ + pos, inst.bytes.data(), inst.size);
+        pos += inst.size;
+    }
+
+    template <size_t INSTRUCTION_SIZE, bool LOCKABLE>
+    void put(size_t &pos, const Instruction<INSTRUCTION_SIZE, LOCKABLE> &inst){
+        std::memcpy(buffer_ + pos, inst.data(), INSTRUCTION_SIZE);
+        pos += INSTRUCTION_SIZE;
+    }
+
+    template <size_t INSTRUCTION_SIZE, size_t REL_SIZE>
+    void put(size_t &pos, const Branch<INSTRUCTION_SIZE, REL_SIZE> &branch){
+        put(pos, branch.inst);
+        fixups_.push_back(Fixup{pos, branch.label, REL_SIZE});
+    }
+
+    template <size_t SHORT_SIZE, size_t NEAR_SIZE>
+    void put(size_t &pos, const Jump<SHORT_SIZE, NEAR_SIZE> &jump){
+        static_assert(NEAR_SIZE <= 8);
+        JumpSite site{pos, jump.label, SHORT_SIZE, NEAR_SIZE, {}};
+        std::memcpy(site.near_form.data(), jump.near_form.data(), NEAR_SIZE);
+        jumps_.push_back(site);
+        put(pos, jump.short_form);
+    }
+
+    std::vector<size_t> labels_;
+    std::vector<Fixup> fixups_;
+    std::vector<JumpSite> jumps_;
+    std::unique_ptr<uint8_t[]> storage_;
+    uint8_t *buffer_ = nullptr;
+    size_t capacity_ = 0;
+    size_t size_ = 0;
+};
+"""
+
+DECODER = """
+// An instruction decoded by decode_instruction(), the operands are described
+// by entry->operand. reg, rm, index and base include the REX/VEX extension bits.
+struct DecodedInstruction{
+    static constexpr uint8_t NO_SEGMENT = 0xFF;
+
+    const Decoded *entry = nullptr;
+    uint8_t length = 0;
+    bool lock = false;
+    bool operand_size_override = false;
+    bool address_size_override = false;
+    // last F2/F3 prefix, 0 if none or if it selected the opcode
+    uint8_t repeat = 0;
+    uint8_t segment = NO_SEGMENT;
+    MandatoryPrefix mandatory = MandatoryPrefix::NONE;
+    uint8_t rex = 0;
+    bool vex = false;
+    bool vex_l = false;
+    uint8_t vvvv = 0;
+    OpcodeMap map = OpcodeMap::LEGACY;
+    uint8_t opcode = 0;
+    // operand size in bytes
+    uint8_t operand_size = 4;
+    uint8_t mod = 0;
+    uint8_t reg = 0;
+    uint8_t rm = 0;
+    bool has_sib = false;
+    uint8_t scale = 0;
+    uint8_t index = 0;
+    uint8_t base = 0;
+    int32_t disp = 0;
+    uint8_t imm_count = 0;
+    uint8_t imm_size[2] = {};
+    uint64_t imm[2] = {};
+};
+
+constexpr uint64_t read_le(const uint8_t *code, size_t size){
+    uint64_t value = 0;
+    for(size_t i = 0; i < size; i++){
+        value |= static_cast<uint64_t>(code[i]) << (i * 8);
+    }
+    return value;
+}
+
+constexpr int64_t sign_extend(uint64_t value, size_t size){
+    return size == 8 ? static_cast<int64_t>(value) : static_cast<int64_t>(value << (64 - size * 8)) >> (64 - size * 8);
+}
+
+// Decodes the instruction at code, returns its length or 0 for unknown or
+// truncated encodings.
+constexpr size_t decode_instruction(const uint8_t *code, size_t size, DecodedInstruction &inst){
+    inst = DecodedInstruction{};
+    size_t end = size < 15 ? size : 15;
+    size_t pos = 0;
+    uint8_t repeat = 0;
+    for(; pos < end; pos++){
+        uint8_t byte = code[pos];
+        if(byte >= 0x40 && byte <= 0x4F){
+            inst.rex = byte;
+            continue;
+        }
+        if(byte == 0xF0){
+            inst.lock = true;
+        }else if(byte == 0xF2 || byte == 0xF3){
+            repeat = byte;
+        }else if(byte == 0x66){
+            inst.operand_size_override = true;
+        }else if(byte == 0x67){
+            inst.address_size_override = true;
+        }else if(byte == 0x26 || byte == 0x2E || byte == 0x36 || byte == 0x3E){
+            inst.segment = (byte >> 3) & 0b11;
+        }else if(byte == 0x64 || byte == 0x65){
+            inst.segment = byte - 0x60;
+        }else{
+            break;
+        }
+        // a REX prefix only counts right before the opcode
+        inst.rex = 0;
+    }
+    if(pos >= end){
+        return 0;
+    }
+
+    MandatoryPrefix prefixes[3] = {};
+    size_t prefix_count = 0;
+    if(code[pos] == 0xC4 || code[pos] == 0xC5){
+        if(inst.rex || pos + (code[pos] == 0xC4 ? 3 : 2) >= end){
+            return 0;
+        }
+        uint8_t byte;
+        if(code[pos] == 0xC5){
+            byte = code[pos + 1];
+            inst.rex = 0x40 | ((~byte >> 7) & 1) << 2;
+            inst.map = OpcodeMap::M0F;
+            pos += 2;
+        }else{
+            byte = code[pos + 2];
+            inst.rex = 0x40 | ((~code[pos + 1] >> 5) & 0b111) | (byte >> 7) << 3;
+            uint8_t map = code[pos + 1] & 0b11111;
+            if(map < 1 || map > 3){
+                return 0;
+            }
+            inst.map = static_cast<OpcodeMap>(map);
+            pos += 3;
+        }
+        inst.vex = true;
+        inst.vvvv = (~byte >> 3) & 0b1111;
+        inst.vex_l = (byte >> 2) & 1;
+        // VEX.pp is none, 66, F3, F2
+        constexpr MandatoryPrefix PP[4] = {MandatoryPrefix::NONE, MandatoryPrefix::P66, MandatoryPrefix::PF3, MandatoryPrefix::PF2};
+        prefixes[prefix_count++] = PP[byte & 0b11];
+    }else{
+        if(code[pos] == 0x0F){
+            inst.map = OpcodeMap::M0F;
+            pos++;
+            if(pos < end && (code[pos] == 0x38 || code[pos] == 0x3A)){
+                inst.map = code[pos] == 0x38 ? OpcodeMap::M0F38 : OpcodeMap::M0F3A;
+                pos++;
+            }
+        }
+        if(repeat){
+            prefixes[prefix_count++] = repeat == 0xF2 ? MandatoryPrefix::PF2 : MandatoryPrefix::PF3;
+        }
+        if(inst.operand_size_override){
+            prefixes[prefix_count++] = MandatoryPrefix::P66;
+        }
+        prefixes[prefix_count++] = MandatoryPrefix::NONE;
+    }
+    if(pos >= end){
+        return 0;
+    }
+
+    inst.opcode = code[pos++];
+    bool have_modrm = pos < end;
+    uint8_t modrm = have_modrm ? code[pos] : 0;
+    uint8_t map = static_cast<uint8_t>(inst.map);
+
+    bool fixed = false;
+    uint16_t slot = 0;
+    for(size_t i = 0; i < prefix_count && !slot; i++){
+        uint8_t prefix = static_cast<uint8_t>(prefixes[i]);
+        for(const DecodeFixed *entry = DECODE_FIXED; entry->entry && have_modrm; entry++){
+            if(entry->prefix == prefix && entry->map == map && entry->opcode == inst.opcode && entry->modrm == modrm){
+                slot = entry->entry;
+                fixed = true;
+                break;
+            }
+        }
+        if(!slot){
+            slot = DECODE_SLOTS[prefix][map][inst.opcode];
+        }
+        inst.mandatory = prefixes[i];
+    }
+    if(slot & 0x8000){
+        if(!have_modrm){
+            return 0;
+        }
+        slot = (slot & 0x7FFF) + ((modrm >> 3) & 0b111);
+    }
+    if(!slot || !DECODE_ENTRIES[slot].mnemonic){
+        return 0;
+    }
+    inst.entry = &DECODE_ENTRIES[slot];
+    if(inst.mandatory != MandatoryPrefix::PF2 && inst.mandatory != MandatoryPrefix::PF3){
+        inst.repeat = repeat;
+    }
+
+    if(inst.rex & 0b1000){
+        inst.operand_size = 8;
+    }else if(inst.operand_size_override && inst.mandatory != MandatoryPrefix::P66){
+        inst.operand_size = 2;
+    }else{
+        inst.operand_size = inst.entry->flags & Decoded::DEFAULT_64 ? 8 : 4;
+    }
+
+    if(fixed){
+        pos++;
+    }else if(inst.entry->flags & Decoded::MODRM){
+        if(!have_modrm){
+            return 0;
+        }
+        pos++;
+        inst.mod = modrm >> 6;
+        inst.reg = ((modrm >> 3) & 0b111) | ((inst.rex >> 2) & 1) << 3;
+        inst.rm = (modrm & 0b111) | (inst.rex & 1) << 3;
+        size_t disp = 0;
+        if(inst.mod != 0b11 && (modrm & 0b111) == 0b100){
+            if(pos >= end){
+                return 0;
+            }
+            uint8_t sib = code[pos++];
+            inst.has_sib = true;
+            inst.scale = sib >> 6;
+            inst.index = ((sib >> 3) & 0b111) | ((inst.rex >> 1) & 1) << 3;
+            inst.base = (sib & 0b111) | (inst.rex & 1) << 3;
+            disp = inst.mod == 0 && (sib & 0b111) == 0b101 ? 4 : 0;
+        }
+        if(inst.mod == 0 && (modrm & 0b111) == 0b101){
+            disp = 4;
+        }
+        disp = inst.mod == 1 ? 1 : inst.mod == 2 ? 4 : disp;
+        if(pos + disp > end){
+            return 0;
+        }
+        inst.disp = static_cast<int32_t>(sign_extend(read_le(code + pos, disp), disp ? disp : 8));
+        pos += disp;
+
+        // register forms of memory-only operands are other instructions
+        for(const DecodeOperand &operand: inst.entry->operand){
+            if(inst.mod == 0b11 && operand.type == DecodeOperandType::MEM){
+                return 0;
+            }
+        }
+    }
+
+    for(const DecodeOperand &operand: inst.entry->operand){
+        size_t imm_size;
+        if(operand.type == DecodeOperandType::IMM){
+            imm_size = operand.size == 8 ? inst.operand_size : operand.size ? operand.size : inst.operand_size < 4 ? inst.operand_size : 4;
+        }else if(operand.type == DecodeOperandType::REL){
+            imm_size = operand.size ? operand.size : 4;
+        }else if(operand.type == DecodeOperandType::MOFFS){
+            imm_size = inst.address_size_override ? 4 : 8;
+        }else{
+            continue;
+        }
+        if(pos + imm_size > end || inst.imm_count == 2){
+            return 0;
+        }
+        inst.imm_size[inst.imm_count] = imm_size;
+        inst.imm[inst.imm_count++] = read_le(code + pos, imm_size);
+        pos += imm_size;
+    }
+
+    inst.length = pos;
+    return pos;
+}
+
+// Appends nasm syntax text to a fixed buffer, truncating at its end.
+struct DisassemblyText{
+    char *out;
+    size_t size;
+    size_t length = 0;
+
+    void put(char c){
+        if(length + 1 < size){
+            out[length] = c;
+            out[length + 1] = 0;
+        }
+        length++;
+    }
+
+    void put(const char *text){
+        while(*text){
+            put(*text++);
+        }
+    }
+
+    void hex(uint64_t value){
+        put("0x");
+        int shift = 60;
+        while(shift > 0 && !((value >> shift) & 0xF)){
+            shift -= 4;
+        }
+        for(; shift >= 0; shift -= 4){
+            put("0123456789abcdef"[(value >> shift) & 0xF]);
+        }
+    }
+
+    void signed_hex(int64_t value){
+        if(value < 0){
+            put('-');
+        }
+        hex(value < 0 ? -static_cast<uint64_t>(value) : value);
+    }
+
+    void number(unsigned value){
+        if(value >= 10){
+            number(value / 10);
+        }
+        put(static_cast<char>('0' + value % 10));
+    }
+};
+
+inline const char *register_name(size_t size, uint8_t id, bool rex){
+    static constexpr const char *NAMES[4][16] = {
+        {"al", "cl", "dl", "bl", "ah", "ch", "dh", "bh", "r8b", "r9b", "r10b", "r11b", "r12b", "r13b", "r14b", "r15b"},
+        {"ax", "cx", "dx", "bx", "sp", "bp", "si", "di", "r8w", "r9w", "r10w", "r11w", "r12w", "r13w", "r14w", "r15w"},
+        {"eax", "ecx", "edx", "ebx", "esp", "ebp", "esi", "edi", "r8d", "r9d", "r10d", "r11d", "r12d", "r13d", "r14d", "r15d"},
+        {"rax", "rcx", "rdx", "rbx", "rsp", "rbp", "rsi", "rdi", "r8", "r9", "r10", "r11", "r12", "r13", "r14", "r15"},
+    };
+    // with any REX prefix the byte registers 4-7 are the low bytes of RSP/RBP/RSI/RDI
+    static constexpr const char *REX_BYTE[4] = {"spl", "bpl", "sil", "dil"};
+    if(size == 1 && rex && id >= 4 && id < 8){
+        return REX_BYTE[id - 4];
+    }
+    return NAMES[size == 1 ? 0 : size == 2 ? 1 : size == 4 ? 2 : 3][id & 0xF];
+}
+
+inline const char *size_name(size_t size){
+    switch(size){
+        case 1: return "byte ";
+        case 2: return "word ";
+        case 4: return "dword ";
+        case 8: return "qword ";
+        case 10: return "tword ";
+        case 16: return "oword ";
+        case 32: return "yword ";
+    }
+    return "";
+}
+
+static constexpr const char *SEGMENT_NAMES[8] = {"es", "cs", "ss", "ds", "fs", "gs", "?", "?"};
+
+inline void format_memory(DisassemblyText &text, const DecodedInstruction &inst, size_t size, uint64_t address){
+    size_t address_size = inst.address_size_override ? 4 : 8;
+    text.put(size_name(size));
+    text.put('[');
+    if(inst.segment == 4 || inst.segment == 5){
+        text.put(SEGMENT_NAMES[inst.segment]);
+        text.put(':');
+    }
+
+    if(inst.mod == 0 && !inst.has_sib && (inst.rm & 0b111) == 0b101){
+        text.put("rel ");
+        text.hex(address + inst.length + inst.disp);
+        text.put(']');
+        return;
+    }
+
+    bool first = true;
+    if(!inst.has_sib){
+        text.put(register_name(address_size, inst.rm, false));
+        first = false;
+    }else{
+        if(!(inst.mod == 0 && (inst.base & 0b111) == 0b101)){
+            text.put(register_name(address_size, inst.base, false));
+            first = false;
+        }
+        if(inst.index != 0b100){
+            if(!first){
+                text.put('+');
+            }
+            text.put(register_name(address_size, inst.index, false));
+            text.put('*');
+            text.number(1u << inst.scale);
+            first = false;
+        }
+    }
+
+    if(first){
+        text.hex(static_cast<uint32_t>(inst.disp));
+    }else if(inst.disp){
+        text.put(inst.disp < 0 ? '-' : '+');
+        text.hex(inst.disp < 0 ? -static_cast<int64_t>(inst.disp) : inst.disp);
+    }
+    text.put(']');
+}
+
+// Writes the operand, returns false for implicit operands that are left out.
+inline bool format_operand(DisassemblyText &text, const DecodedInstruction &inst, const DecodeOperand &operand, size_t &imm, uint64_t address){
+    size_t size = operand.size ? operand.size : inst.operand_size;
+    bool memory = inst.mod != 0b11;
+    switch(operand.type){
+        case DecodeOperandType::RM:
+        case DecodeOperandType::MEM:
+        case DecodeOperandType::MM_RM:
+        case DecodeOperandType::XMM_RM:
+            if(memory || operand.type == DecodeOperandType::MEM){
+                // memory operands of instructions without ModRM (MOVS, STOS, ...) are implicit
+                if(!(inst.entry->flags & Decoded::MODRM)){
+                    return false;
+                }
+                format_memory(text, inst, operand.size ? operand.size : operand.type == DecodeOperandType::RM ? inst.operand_size : 0, address);
+                return true;
+            }
+            break;
+        default:
+            break;
+    }
+
+    switch(operand.type){
+        case DecodeOperandType::REG:
+            text.put(register_name(size, inst.reg, inst.rex));
+            return true;
+        case DecodeOperandType::RM:
+            text.put(register_name(size, inst.rm, inst.rex));
+            return true;
+        case DecodeOperandType::OPREG:
+            text.put(register_name(size, (inst.opcode & 0b111) | (inst.rex & 1) << 3, inst.rex));
+            return true;
+        case DecodeOperandType::GP:
+            text.put(register_name(size, operand.id, inst.rex));
+            return true;
+        case DecodeOperandType::MM:
+        case DecodeOperandType::MM_RM:
+            text.put("mm");
+            text.number((operand.type == DecodeOperandType::MM ? inst.reg : inst.rm) & 0b111);
+            return true;
+        case DecodeOperandType::XMM:
+        case DecodeOperandType::XMM_RM:
+            text.put(inst.vex_l ? "ymm" : "xmm");
+            text.number(operand.type == DecodeOperandType::XMM ? inst.reg : inst.rm);
+            return true;
+        case DecodeOperandType::IMM:{
+            size_t imm_size = inst.imm_size[imm];
+            uint64_t value = inst.imm[imm++];
+            // sign-extended immediates are written signed, so nasm picks the same form
+            size_t smallest = 0;
+            for(const DecodeOperand &other: inst.entry->operand){
+                if(other.type == DecodeOperandType::REG || other.type == DecodeOperandType::RM
+                    || other.type == DecodeOperandType::OPREG || other.type == DecodeOperandType::GP){
+                    size_t other_size = other.size ? other.size : inst.operand_size;
+                    smallest = smallest && smallest < other_size ? smallest : other_size;
+                }
+            }
+            if((imm_size == 1 || imm_size == 4) && imm_size < inst.operand_size && smallest > imm_size){
+                text.signed_hex(sign_extend(value, imm_size));
+            }else{
+                text.hex(value);
+            }
+            return true;
+        }
+        case DecodeOperandType::REL:{
+            size_t imm_size = inst.imm_size[imm];
+            uint64_t value = inst.imm[imm++];
+            text.hex(address + inst.length + sign_extend(value, imm_size));
+            return true;
+        }
+        case DecodeOperandType::MOFFS:
+            text.put(size_name(size));
+            text.put('[');
+            text.hex(inst.imm[imm++]);
+            text.put(']');
+            return true;
+        case DecodeOperandType::SREG:
+            text.put(SEGMENT_NAMES[inst.reg & 0b111]);
+            return true;
+        case DecodeOperandType::SEG:
+            text.put(SEGMENT_NAMES[operand.id & 0b111]);
+            return true;
+        case DecodeOperandType::CR:
+        case DecodeOperandType::DR:
+            text.put(operand.type == DecodeOperandType::CR ? "cr" : "dr");
+            text.number(inst.reg);
+            return true;
+        case DecodeOperandType::ST:
+            // the implicit ST of memory forms and FLD1, FLDZ, ... is not written
+            for(const DecodeOperand &other: inst.entry->operand){
+                if(other.type == DecodeOperandType::STI){
+                    text.put("st");
+                    text.number(operand.id);
+                    return true;
+                }
+            }
+            return false;
+        case DecodeOperandType::STI:
+            text.put("st");
+            text.number(inst.rm & 0b111);
+            return true;
+        case DecodeOperandType::ONE:
+            text.put('1');
+            return true;
+        default:
+            return false;
+    }
+}
+
+// Writes the nasm syntax of inst at address into out, returns the length of
+// the full text. Branch targets and RIP-relative operands are absolute.
+inline size_t format_instruction(const DecodedInstruction &inst, uint64_t address, char *out, size_t size){
+    DisassemblyText text{out, size};
+    if(size){
+        out[0] = 0;
+    }
+    if(inst.lock){
+        text.put("lock ");
+    }
+    if(inst.repeat){
+        text.put(inst.repeat == 0xF2 ? "repne " : "rep ");
+    }
+    if(inst.vex){
+        text.put('v');
+    }
+    for(const char *c = inst.entry->mnemonic; *c; c++){
+        text.put(static_cast<char>(*c >= 'A' && *c <= 'Z' ? *c - 'A' + 'a' : *c));
+    }
+
+    size_t imm = 0;
+    size_t count = 0;
+    for(const DecodeOperand &operand: inst.entry->operand){
+        if(operand.type == DecodeOperandType::NONE){
+            continue;
+        }
+        size_t mark = text.length;
+        text.put(count ? ", " : " ");
+        if(!format_operand(text, inst, operand, imm, address)){
+            text.length = mark;
+            if(mark < size){
+                out[mark] = 0;
+            }
+            continue;
+        }
+        // VEX.vvvv is the first source, it is left out when it holds register 0
+        if(count++ == 0 && inst.vex && inst.vvvv){
+            text.put(inst.vex_l ? ", ymm" : ", xmm");
+            text.number(inst.vvvv);
+        }
+    }
+    return text.length;
+}
+
+// Disassembles the instruction at code into out, returns the number of bytes
+// consumed. Undecodable bytes are written as db.
+inline size_t disassemble(const uint8_t *code, size_t size, uint64_t address, char *out, size_t out_size){
+    DecodedInstruction inst;
+    size_t length = decode_instruction(code, size, inst);
+    if(length){
+        format_instruction(inst, address, out, out_size);
+        return length;
+    }
+    DisassemblyText text{out, out_size};
+    if(out_size){
+        out[0] = 0;
+    }
+    if(size){
+        text.put("db ");
+        text.hex(code[0]);
+    }
+    return size ? 1 : 0;
+}
+"""
+
+RUNTIME = """
+// Encoders for register allocators that pick registers at run time. Registers
+// are plain 0-15 ids, REX, ModRM and SIB are computed without branching on
+// them: optional bytes are always stored and skipped by advancing out by 0 or
+// 1. Every encoder returns the end of the instruction and may store up to 4
+// bytes past it, out needs room for 19 bytes.
+//
+// Byte register ids 4-7 are AH, CH, DH and BH as in the typed and batch APIs,
+// the byte forms throw std::invalid_argument when one of them meets a REX
+// prefix, which would make it SPL-DIL.
+
+// Memory operand, scale is the log2 of the factor.
+struct Address{
+    RegId base;
+    RegId index = Mem::NO_INDEX;
+    uint8_t scale = 0;
+    int32_t disp = 0;
+};
+
+// Stores REX with the given W/R/X/B bits, keeps it if any is set.
+constexpr uint8_t *rex(uint8_t *out, uint8_t bits){
+    *out = 0x40 | bits;
+    return out + (bits != 0);
+}
+
+constexpr bool high_byte(RegId id){
+    return (id >> 2) == 1;
+}
+
+constexpr void check_high_byte(uint8_t bits, bool high){
+    if(bits && high){
+        throw std::invalid_argument("x86::runtime: AH, CH, DH and BH can not be encoded with a REX prefix");
+    }
+}
+
+constexpr uint8_t address_rex(const Address &mem){
+    bool have_index = mem.index != Mem::NO_INDEX;
+    return (mem.base >> 3) | ((mem.index >> 3) & have_index) << 1;
+}
+
+template <size_t SIZE>
+constexpr uint8_t *immediate(uint8_t *out, uint64_t value){
+    [&]<size_t... I>(std::index_sequence<I...>){
+        ((out[I] = static_cast<uint8_t>(value >> (I * 8))), ...);
+    }(std::make_index_sequence<SIZE>{});
+    return out + SIZE;
+}
+
+// ModRM, SIB and the shortest displacement, like memory_operand.
+constexpr uint8_t *address(uint8_t *out, uint8_t reg, const Address &mem){
+    uint8_t base = mem.base & 0b111;
+    uint8_t have_index = mem.index != Mem::NO_INDEX;
+    uint8_t have_sib = have_index | (base == 0b100);
+    // RBP/R13 need a displacement, mod is 0, 1 (disp8) or 2 (disp32)
+    uint8_t need_disp = (mem.disp != 0) | (base == 0b101);
+    uint8_t disp32 = static_cast<uint32_t>(mem.disp) + 128 > 255;
+    uint8_t mod = need_disp << disp32;
+    uint8_t sib_mask = -have_sib;
+    uint8_t index_mask = -have_index;
+
+    *out++ = mod_rm(mod, reg, base ^ ((base ^ 0b100) & sib_mask));
+    *out = sib(mem.scale, 0b100 ^ ((mem.index ^ 0b100) & index_mask), base);
+    out += have_sib;
+    // the displacement is 0, 1 or 4 bytes long
+    return immediate<4>(out, static_cast<uint32_t>(mem.disp)) - 4 + mod * mod;
+}
+"""
+
+PYTHON_MODULE = """# Generated by generate.py, do not edit.
+#
+# Registers are their 0-15 encoding ids, memory operands are Mem objects.
+# Byte register ids 4-7 are AH-BH as in the C++ APIs, SPL-DIL have no id.
+# Every form is a precomputed template of prefixes, REX and opcode bytes,
+# the operands are patched into REX, the opcode and ModRM.
+
+MODRM = 0b001
+REG_OPERAND = 0b010
+OPCODE_REG = 0b100
+BYTE_REG = 0b01000
+BYTE_RM = 0b10000
+
+NO_INDEX = 0xFF
+
+AL, CL, DL, BL, AH, CH, DH, BH, R8B, R9B, R10B, R11B, R12B, R13B, R14B, R15B = range(16)
+AX, CX, DX, BX, SP, BP, SI, DI, R8W, R9W, R10W, R11W, R12W, R13W, R14W, R15W = range(16)
+EAX, ECX, EDX, EBX, ESP, EBP, ESI, EDI, R8D, R9D, R10D, R11D, R12D, R13D, R14D, R15D = range(16)
+RAX, RCX, RDX, RBX, RSP, RBP, RSI, RDI, R8, R9, R10, R11, R12, R13, R14, R15 = range(16)
+MM0, MM1, MM2, MM3, MM4, MM5, MM6, MM7 = range(8)
+XMM0, XMM1, XMM2, XMM3, XMM4, XMM5, XMM6, XMM7, XMM8, XMM9, XMM10, XMM11, XMM12, XMM13, XMM14, XMM15 = range(16)
+
+def mod_rm(mod: int, reg: int, rm: int) -> int:
+    return mod << 6 | (reg & 0b111) << 3 | (rm & 0b111)
+
+def sib(scale: int, index: int, base: int) -> int:
+    return scale << 6 | (index & 0b111) << 3 | (base & 0b111)
+
+class Mem:
+    # ModRM (with ModRM.reg left 0), SIB and the shortest displacement are
+    # encoded once, RBP/R13 as base always take a displacement, RSP/R12 a SIB.
+    __slots__ = ('base', 'index', 'scale', 'disp', 'rex', 'template')
+
+    def __init__(self, base: int, index: int = NO_INDEX, scale: int = 1, disp: int = 0):
+        if index == RSP:
+            raise ValueError('RSP can not be an index register')
+        if scale not in (1, 2, 4, 8):
+            raise ValueError(f'invalid scale {scale}')
+
+        self.base = base
+        self.index = index
+        self.scale = scale.bit_length() - 1
+        self.disp = disp
+
+        have_index = index != NO_INDEX
+        have_sib = have_index or (base & 0b111) == 0b100
+        self.rex = base >> 3 | ((index >> 3) << 1 if have_index else 0)
+
+        if disp == 0 and (base & 0b111) != 0b101:
+            mod, size = 0b00, 0
+        elif -128 <= disp <= 127:
+            mod, size = 0b01, 1
+        else:
+            mod, size = 0b10, 4
+
+        template = bytearray([mod_rm(mod, 0, 0b100 if have_sib else base)])
+        if have_sib:
+            template.append(sib(self.scale, index if have_index else 0b100, base))
+        template += disp.to_bytes(size, 'little', signed=True)
+        self.template = bytes(template)
+
+    def __repr__(self) -> str:
+        return f'Mem({self.base}, {self.index}, {1 << self.scale}, {self.disp})'
+
+def encode_into(buffer, pos: int, op: int, operands = (), imm: int = 0) -> int:
+    # Writes one instruction at buffer[pos], buffer is a bytearray or a
+    # writable memoryview with room for 15 bytes, returns the end position.
+    prefixes, rex, opcode, reg, rm_slot, flags, imm_size = FORMS[op]
+    rm = operands[rm_slot] if operands else 0
+    if flags & REG_OPERAND:
+        reg = operands[reg]
+    memory = type(rm) is Mem
+
+    end = pos + len(prefixes)
+    buffer[pos:end] = prefixes
+    rex |= (reg >> 3) << 2 | (rm.rex if memory else rm >> 3)
+    # with a REX prefix the byte register ids 4-7 would be SPL-DIL
+    if rex and (flags & BYTE_REG and reg >> 2 == 1 or flags & BYTE_RM and not memory and rm >> 2 == 1):
+        raise ValueError(f'{FORM_NAMES[op]}: AH, CH, DH and BH can not be encoded with a REX prefix')
+    if rex:
+        buffer[end] = 0x40 | rex
+        end += 1
+
+    pos, end = end, end + len(opcode)
+    buffer[pos:end] = opcode
+    if flags & OPCODE_REG:
+        buffer[end - 1] += rm & 0b111
+
+    if flags & MODRM:
+        if memory:
+            pos, end = end, end + len(rm.template)
+            buffer[pos:end] = rm.template
+            buffer[pos] |= (reg & 0b111) << 3
+        else:
+            buffer[end] = mod_rm(0b11, reg, rm)
+            end += 1
+
+    if imm_size:
+        pos, end = end, end + imm_size
+        buffer[pos:end] = imm.to_bytes(imm_size, 'little', signed=imm < 0)
+
+    return end
+
+def encode(op: int, *operands, imm: int = 0) -> bytes:
+    buffer = bytearray(15)
+    return bytes(buffer[:encode_into(buffer, 0, op, operands, imm)])
+
+def encode_all(insts) -> bytearray:
+    # insts are (op, operands, imm) tuples, encoded into one buffer
+    insts = list(insts)
+    buffer = bytearray(15 * len(insts))
+    pos = 0
+    for op, operands, imm in insts:
+        pos = encode_into(buffer, pos, op, operands, imm)
+    del buffer[pos:]
+    return buffer
+
+def encode_array(op: int, operands, imm = None, out = None):
+    # Encodes one form for every row of operands, an (n, slots) array of
+    # register ids, with one vectorized pass per template byte. Returns the
+    # (n, 15) uint8 matrix and the size of each row, memory operands go
+    # through encode_into().
+    import numpy as np
+
+    prefixes, rex, opcode, reg, rm_slot, flags, imm_size = FORMS[op]
+    if imm_size and imm is None:
+        raise ValueError(f'{FORM_NAMES[op]} takes a {8 * imm_size}-bit immediate, imm is missing')
+    operands = np.asarray(operands, dtype=np.uint8)
+    n = len(operands)
+    operands = operands.reshape(n, -1)
+    if out is None:
+        out = np.zeros((n, 15), dtype=np.uint8)
+    rows = np.arange(n)
+
+    zero = np.zeros(n, dtype=np.uint8)
+    rm = operands[:, rm_slot] if operands.shape[1] else zero
+    regs = operands[:, reg] if flags & REG_OPERAND else zero + reg
+
+    out[:, :len(prefixes)] = list(prefixes)
+    rexes = rex | (regs >> 3) << 2 | rm >> 3
+    have_rex = rexes != 0
+    # with a REX prefix the byte register ids 4-7 would be SPL-DIL
+    high = np.zeros(n, dtype=bool)
+    if flags & BYTE_REG:
+        high |= regs >> 2 == 1
+    if flags & BYTE_RM:
+        high |= rm >> 2 == 1
+    bad = np.flatnonzero(have_rex & high)
+    if len(bad):
+        raise ValueError(f'{FORM_NAMES[op]}: row {bad[0]}: AH, CH, DH and BH can not be encoded with a REX prefix')
+    out[have_rex, len(prefixes)] = 0x40 | rexes[have_rex]
+    pos = len(prefixes) + have_rex
+
+    for byte in opcode:
+        out[rows, pos] = byte
+        pos = pos + 1
+    if flags & OPCODE_REG:
+        out[rows, pos - 1] += rm & 0b111
+
+    if flags & MODRM:
+        out[rows, pos] = 0b11000000 | (regs & 0b111) << 3 | rm & 0b111
+        pos = pos + 1
+
+    if imm_size:
+        imm = np.broadcast_to(np.asarray(imm, dtype='<i8'), (n,))
+        imm = np.ascontiguousarray(imm).view(np.uint8).reshape(n, 8)
+        for i in range(imm_size):
+            out[rows, pos] = imm[:, i]
+            pos = pos + 1
+
+    return out, pos
+
+def pack(out, sizes) -> bytes:
+    # Concatenates the first sizes[i] bytes of every row of encode_array()
+    import numpy as np
+
+    return out[np.arange(out.shape[1]) < np.asarray(sizes)[:, None]].tobytes()
+
+LEGACY_PREFIXES = {0xF0, 0xF2, 0xF3, 0x2E, 0x36, 0x3E, 0x26, 0x64, 0x65, 0x66, 0x67}
+SEGMENT_PREFIXES = {0x26: 'es', 0x2E: 'cs', 0x36: 'ss', 0x3E: 'ds', 0x64: 'fs', 0x65: 'gs'}
+
+GP_NAMES = {
+    1: ['al', 'cl', 'dl', 'bl', 'ah', 'ch', 'dh', 'bh'] + [f'r{i}b' for i in range(8, 16)],
+    2: ['ax', 'cx', 'dx', 'bx', 'sp', 'bp', 'si', 'di'] + [f'r{i}w' for i in range(8, 16)],
+    4: ['eax', 'ecx', 'edx', 'ebx', 'esp', 'ebp', 'esi', 'edi'] + [f'r{i}d' for i in range(8, 16)],
+    8: ['rax', 'rcx', 'rdx', 'rbx', 'rsp', 'rbp', 'rsi', 'rdi'] + [f'r{i}' for i in range(8, 16)],
+}
+# with any REX prefix the byte registers 4-7 are the low bytes of RSP/RBP/RSI/RDI
+GP8_REX_NAMES = ['al', 'cl', 'dl', 'bl', 'spl', 'bpl', 'sil', 'dil'] + GP_NAMES[1][8:]
+SEGMENT_NAMES = ['es', 'cs', 'ss', 'ds', 'fs', 'gs', '?', '?']
+SIZE_NAMES = {1: 'byte ', 2: 'word ', 4: 'dword ', 8: 'qword ', 10: 'tword ', 16: 'oword ', 32: 'yword '}
+
+class Decoded:
+    __slots__ = (
+        'length', 'entry', 'mnemonic', 'flags', 'operands', 'prefixes', 'mandatory', 'rex', 'vex', 'vvvv', 'opsize',
+        'opcode', 'mod', 'reg', 'rm', 'sib', 'disp', 'imms',
+    )
+
+    def text(self, address: int = 0) -> str:
+        # nasm syntax, branch targets and RIP-relative operands are absolute
+        # addresses with the instruction at address
+        imms = iter(self.imms)
+        operands = [operand_text(self, operand, address, imms) for operand in self.operands]
+        if self.vex and self.vvvv and len(operands) > 1:
+            # VEX.vvvv is the first source, it is left out when it holds register 0
+            operands.insert(1, f'{self.vex[1] and "ymm" or "xmm"}{self.vvvv}')
+        operands = [operand for operand in operands if operand]
+
+        prefixes = ''
+        if 0xF0 in self.prefixes:
+            prefixes += 'lock '
+        repeat = [p for p in self.prefixes if p in (0xF2, 0xF3)]
+        if repeat and self.mandatory not in (0xF2, 0xF3):
+            prefixes += repeat[-1] == 0xF2 and 'repne ' or 'rep '
+
+        return prefixes + self.mnemonic.lower() + (operands and ' ' + ', '.join(operands) or '')
+
+def signed_hex(value: int) -> str:
+    return value < 0 and f'-0x{-value:x}' or f'0x{value:x}'
+
+def memory_text(inst, size: int, address: int) -> str:
+    names = GP_NAMES[0x67 in inst.prefixes and 4 or 8]
+    segment = ''.join(SEGMENT_PREFIXES[p] + ':' for p in inst.prefixes if p in (0x64, 0x65))
+
+    if inst.mod == 0 and inst.sib is None and inst.rm & 0b111 == 0b101:
+        return f'{SIZE_NAMES.get(size, "")}[{segment}rel 0x{(address + inst.length + inst.disp) & 0xFFFFFFFFFFFFFFFF:x}]'
+
+    parts = []
+    if inst.sib is None:
+        parts.append(names[inst.rm])
+    else:
+        scale, index, base = inst.sib
+        if not (inst.mod == 0 and base & 0b111 == 0b101):
+            parts.append(names[base])
+        if index != 0b100:
+            parts.append(f'{names[index]}*{1 << scale}')
+
+    text = '+'.join(parts)
+    if not parts:
+        text = f'0x{inst.disp & 0xFFFFFFFF:x}'
+    elif inst.disp:
+        text += (inst.disp < 0 and '-' or '+') + f'0x{abs(inst.disp):x}'
+    return f'{SIZE_NAMES.get(size, "")}[{segment}{text}]'
+
+def register_text(inst, size: int, id: int) -> str:
+    return (size == 1 and inst.rex and GP8_REX_NAMES or GP_NAMES[size])[id]
+
+def operand_text(inst, operand, address: int, imms) -> str:
+    kind, size, id = operand
+    size = size or inst.opsize
+
+    if kind in (OPERAND_RM, OPERAND_MEM, OPERAND_MM_RM, OPERAND_XMM_RM) and inst.mod != 0b11:
+        # memory operands of instructions without ModRM (MOVS, STOS, ...) are implicit
+        return inst.flags & DECODE_MODRM and memory_text(inst, operand[1] or (kind == OPERAND_RM and inst.opsize or 0), address) or ''
+    elif kind == OPERAND_REG:
+        return register_text(inst, size, inst.reg)
+    elif kind == OPERAND_RM:
+        return register_text(inst, size, inst.rm)
+    elif kind == OPERAND_OPREG:
+        return register_text(inst, size, (inst.opcode & 0b111) | (inst.rex & 1) << 3)
+    elif kind == OPERAND_GP:
+        return register_text(inst, size, id)
+    elif kind in (OPERAND_MM, OPERAND_MM_RM):
+        return f'mm{(inst.reg if kind == OPERAND_MM else inst.rm) & 0b111}'
+    elif kind in (OPERAND_XMM, OPERAND_XMM_RM):
+        return f'{inst.vex and inst.vex[1] and "ymm" or "xmm"}{inst.reg if kind == OPERAND_XMM else inst.rm}'
+    elif kind == OPERAND_IMM:
+        value, imm_size = next(imms)
+        # sign-extended immediates are written signed, so nasm picks the same form
+        sizes = [other[1] or inst.opsize for other in inst.operands if other[0] in (OPERAND_REG, OPERAND_RM, OPERAND_OPREG, OPERAND_GP)]
+        if imm_size in (1, 4) and imm_size < inst.opsize and sizes and min(sizes) > imm_size:
+            return signed_hex(value - (value >> (8 * imm_size - 1) << (8 * imm_size)))
+        return f'0x{value:x}'
+    elif kind == OPERAND_REL:
+        value, imm_size = next(imms)
+        value -= value >> (8 * imm_size - 1) << (8 * imm_size)
+        return f'0x{(address + inst.length + value) & 0xFFFFFFFFFFFFFFFF:x}'
+    elif kind == OPERAND_MOFFS:
+        value, imm_size = next(imms)
+        return f'{SIZE_NAMES[size]}[0x{value:x}]'
+    elif kind == OPERAND_SREG:
+        return SEGMENT_NAMES[inst.reg & 0b111]
+    elif kind == OPERAND_SEG:
+        return SEGMENT_NAMES[id]
+    elif kind in (OPERAND_CR, OPERAND_DR):
+        return f'{kind == OPERAND_CR and "cr" or "dr"}{inst.reg}'
+    elif kind == OPERAND_ST:
+        # the implicit ST of memory forms and FLD1, FLDZ, ... is not written
+        return any(other[0] == OPERAND_STI for other in inst.operands) and f'st{id}' or ''
+    elif kind == OPERAND_STI:
+        return f'st{inst.rm & 0b111}'
+    elif kind == OPERAND_ONE:
+        return '1'
+    return ''
+
+def decode(data, pos: int = 0):
+    # Decodes the instruction at data[pos], returns None for unknown or
+    # truncated encodings.
+    start = pos
+    end = min(len(data), pos + 15)
+    inst = Decoded()
+    inst.prefixes = []
+    inst.rex = 0
+    while pos < end and (data[pos] in LEGACY_PREFIXES or 0x40 <= data[pos] <= 0x4F):
+        if data[pos] in LEGACY_PREFIXES:
+            # a REX prefix only counts right before the opcode
+            inst.prefixes.append(data[pos])
+            inst.rex = 0
+        else:
+            inst.rex = data[pos]
+        pos += 1
+    if pos >= end:
+        return None
+
+    inst.vex = None
+    inst.vvvv = 0
+    map = 0
+    if data[pos] in (0xC4, 0xC5):
+        if inst.rex or pos + (data[pos] == 0xC4 and 3 or 2) >= end:
+            return None
+        if data[pos] == 0xC5:
+            byte = data[pos + 1]
+            inst.rex = 0x40 | (~byte >> 7 & 1) << 2
+            map = 1
+            pos += 2
+        else:
+            byte = data[pos + 2]
+            inst.rex = 0x40 | (~data[pos + 1] >> 5 & 0b111) | (byte >> 7) << 3
+            map = data[pos + 1] & 0b11111
+            if map not in (1, 2, 3):
+                return None
+            pos += 3
+        inst.vvvv = ~byte >> 3 & 0b1111
+        inst.vex = (byte & 0b11, byte >> 2 & 1)
+        # VEX.pp is none, 66, F3, F2
+        prefixes = [[0, 1, 3, 2][byte & 0b11]]
+    else:
+        if data[pos] == 0x0F:
+            map = 1
+            pos += 1
+            if pos < end and data[pos] in (0x38, 0x3A):
+                map = data[pos] == 0x38 and 2 or 3
+                pos += 1
+        repeat = [p for p in inst.prefixes if p in (0xF2, 0xF3)][-1:]
+        prefixes = [*(repeat and [repeat[0] == 0xF2 and 2 or 3] or []), *(0x66 in inst.prefixes and [1] or []), 0]
+    if pos >= end:
+        return None
+
+    inst.opcode = data[pos]
+    pos += 1
+    modrm = data[pos] if pos < end else None
+
+    index = None
+    fixed = False
+    for prefix in prefixes:
+        index = DECODE_FIXED.get((prefix, map, inst.opcode, modrm))
+        fixed = index is not None
+        slot = index if fixed else DECODE_SLOTS.get(prefix << 10 | map << 8 | inst.opcode, 0)
+        if slot:
+            if slot & 0x8000 and not fixed:
+                if modrm is None:
+                    return None
+                slot = (slot & 0x7FFF) + (modrm >> 3 & 0b111)
+            index = slot
+            break
+    if not index or not DECODE_ENTRIES[index][0]:
+        return None
+
+    inst.entry = index
+    inst.mnemonic, inst.flags, inst.operands = DECODE_ENTRIES[index]
+    inst.mnemonic = (inst.vex and 'V' or '') + inst.mnemonic
+    inst.mandatory = [None, 0x66, 0xF2, 0xF3][prefix]
+
+    if inst.rex & 0b1000:
+        inst.opsize = 8
+    elif 0x66 in inst.prefixes and inst.mandatory != 0x66:
+        inst.opsize = 2
+    else:
+        inst.opsize = inst.flags & DECODE_DEFAULT_64 and 8 or 4
+
+    inst.mod = inst.reg = inst.rm = 0
+    inst.sib = None
+    inst.disp = 0
+    if fixed:
+        pos += 1
+    elif inst.flags & DECODE_MODRM:
+        if modrm is None:
+            return None
+        pos += 1
+        inst.mod, inst.reg, inst.rm = modrm >> 6, (modrm >> 3 & 0b111) | (inst.rex >> 2 & 1) << 3, (modrm & 0b111) | (inst.rex & 1) << 3
+        disp = 0
+        if inst.mod != 0b11 and modrm & 0b111 == 0b100:
+            if pos >= end:
+                return None
+            sib = data[pos]
+            pos += 1
+            inst.sib = (sib >> 6, (sib >> 3 & 0b111) | (inst.rex >> 1 & 1) << 3, (sib & 0b111) | (inst.rex & 1) << 3)
+            disp = inst.mod == 0 and sib & 0b111 == 0b101 and 4 or 0
+        if inst.mod == 0 and modrm & 0b111 == 0b101:
+            disp = 4
+        disp = inst.mod == 1 and 1 or inst.mod == 2 and 4 or disp
+        if pos + disp > end:
+            return None
+        inst.disp = int.from_bytes(bytes(data[pos:pos + disp]), 'little', signed=True)
+        pos += disp
+
+        # register forms of memory-only operands are other instructions
+        if inst.mod == 0b11 and any(operand[0] == OPERAND_MEM for operand in inst.operands):
+            return None
+
+    inst.imms = []
+    for kind, size, id in inst.operands:
+        if kind == OPERAND_IMM:
+            size = size == 8 and inst.opsize or size or min(inst.opsize, 4)
+        elif kind == OPERAND_REL:
+            size = size or 4
+        elif kind == OPERAND_MOFFS:
+            size = 0x67 in inst.prefixes and 4 or 8
+        else:
+            continue
+        if pos + size > end:
+            return None
+        inst.imms.append((int.from_bytes(bytes(data[pos:pos + size]), 'little'), size))
+        pos += size
+
+    inst.length = pos - start
+    return inst
+
+def disassemble(data, address: int = 0):
+    # Yields (address, bytes, text) for every instruction, undecodable bytes
+    # are written as db
+    data = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        inst = decode(data, pos)
+        if inst is None:
+            yield address + pos, bytes(data[pos:pos + 1]), f'db 0x{data[pos]:x}'
+            pos += 1
+            continue
+        yield address + pos, bytes(data[pos:pos + inst.length]), inst.text(address + pos)
+        pos += inst.length
+"""
+
+def generate_shard(shard: list) -> list[tuple[int, dict[str, str]]]:
+    # every shard holds all rows of its mnemonics, so deduplication never
+    # depends on what the other shards have seen
+    generated.clear()
+    branch_forms.clear()
+    alu_forms.clear()
+    out = Emitter(None)
+    res = []
+    for i, inst in shard:
+        try:
+            families = generate_instruction(inst)
+        except Exception as e:
+            families = {instruction_family(inst): [f'// ERROR: {e}']}
+
+        texts = {}
+        for family, lines in families.items():
+            out.lines(lines)
+            texts[family] = out.text()
+        res.append((i, texts))
+
+    return res
+
+def shards(insts, count: int) -> list[list]:
+    groups = {}
+    for i, inst in enumerate(insts):
+        groups.setdefault(inst.mnemonic, []).append((i, inst))
+
+    res = [[] for _ in range(count)]
+    for n, group in enumerate(groups.values()):
+        res[n % count] += group
+
+    return [shard for shard in res if shard]
+
+def generate_instructions(insts, jobs: int) -> list[dict[str, str]]:
+    if jobs == 1:
+        results = generate_shard(list(enumerate(insts)))
+    else:
+        # several shards per worker keep the pool busy while the big families finish
+        with multiprocessing.Pool(jobs or None) as pool:
+            results = itertools.chain(*pool.imap_unordered(generate_shard, shards(insts, 4 * (jobs or os.cpu_count()))))
+
+    return [texts for i, texts in sorted(results, key=lambda result: result[0])]
+
+def header(includes: list[str], text: str) -> str:
+    return '#pragma once\n\n' + ''.join(f'#include "{include}"\n' for include in includes) + '\nnamespace x86{\n' + text + '}\n'
+
+def generate_decode_header(insts) -> str:
+    out = Emitter(None)
+    out.lines([''] + generate_decode_table(insts))
+    out.raw(DECODER)
+    return out.text()
+
+def python_bytes(values) -> str:
+    return "b'" + ''.join('\\x%02X' % b for b in values) + "'"
+
+def generate_python_module(insts) -> str:
+    forms = batch_forms(insts)
+
+    out = PYTHON_MODULE + '\n'
+    out += ''.join(f'{form.name} = {i}\n' for i, form in enumerate(forms))
+    out += '\nFORM_NAMES = [\n' + ''.join(f'    {form.name!r},\n' for form in forms) + ']\n'
+    out += '\n# prefixes, REX, opcode, ModRM.reg (operand slot with REG_OPERAND), ModRM.rm operand slot, flags, immediate size\n'
+    out += 'FORMS = [\n'
+    for form in forms:
+        out += f'    ({python_bytes(form.prefixes)}, {"0x%02X" % form.rex}, {python_bytes(form.opcode)}, {form.reg}, {form.rm}, {form.flags}, {form.imm}),  # {form.name}\n'
+    out += ']\n'
+
+    entries, index, fixed = decode_tables(insts)
+    out += '\n'
+    out += ''.join(f'{name} = {value}\n' for name, value in [
+        ('DECODE_MODRM', bin(DECODE_MODRM)), ('DECODE_REG_IN_OPCODE', bin(DECODE_REG_IN_OPCODE)),
+        ('DECODE_LOCKABLE', bin(DECODE_LOCKABLE)), ('DECODE_DEFAULT_64', bin(DECODE_DEFAULT_64)),
+    ])
+    out += '\n' + ''.join(f'OPERAND_{kind} = {i}\n' for i, kind in enumerate(DECODE_OPERAND_TYPES))
+    out += '\n# mnemonic, flags, (type, size, register id) of every operand\n'
+    out += 'DECODE_ENTRIES = [\n    (None, 0, ()),\n'
+    for entry in entries[1:]:
+        if not entry:
+            out += '    (None, 0, ()),\n'
+            continue
+        operands = ', '.join(f'(OPERAND_{kind}, {size}, {id})' for kind, size, id in entry.operands)
+        operands += len(entry.operands) == 1 and ',' or ''
+        out += f'    ({entry.mnemonic!r}, {entry.flags}, ({operands})),  # {", ".join(entry.ops)}\n'
+    out += ']\n'
+    out += '\n# prefix << 10 | map << 8 | opcode, the high bit marks 8 entries selected by ModRM.reg\n'
+    out += 'DECODE_SLOTS = {\n'
+    out += ''.join(f'    0x{prefix << 10 | map << 8 | opcode:03X}: 0x{slot:04X},\n' for (prefix, map, opcode), slot in index.items())
+    out += '}\n'
+    out += '\n# (prefix, map, opcode, ModRM) of the opcodes with a fixed ModRM byte\n'
+    out += 'DECODE_FIXED = {\n'
+    out += ''.join(f'    ({prefix}, {map}, 0x{opcode:02X}, 0x{modrm:02X}): {entry},\n' for (prefix, map, opcode, modrm), entry in fixed.items())
+    out += '}\n'
+    return out
+
+def fingerprint(*parts) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+def write_if_changed(path: str, text: str) -> bool:
     try:
-        print(cat(generate_instruction(inst)))
-    except Exception as e:
-        print(f'// ERROR: {e}')
+        with open(path) as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
 
-print('}')
\ No newline at end of file
+    with open(path + '.tmp', 'w') as f:
+        f.write(text)
+    os.replace(path + '.tmp', path)
+    return True
+
+def write_split(path: str, insts, jobs: int):
+    directory = os.path.join(path, 'x86')
+    os.makedirs(directory, exist_ok=True)
+
+    # Every header is fingerprinted with the generator source and the rows it
+    # is generated from. A family depends on all rows of its mnemonics, the
+    # deduplication of overloads works across them.
+    manifest_path = os.path.join(directory, 'manifest.json')
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    with open(__file__, 'rb') as f:
+        generator = hashlib.sha256(f.read()).hexdigest()
+
+    mnemonics = {family: set() for family in FAMILIES}
+    for inst in insts:
+        for family in instruction_families(inst):
+            mnemonics[family].add(inst.mnemonic)
+
+    fingerprints = {'base': fingerprint(generator), 'assembler': fingerprint(generator)}
+    for family in FAMILIES:
+        fingerprints[family] = fingerprint(generator, [inst.orig for inst in insts if inst.mnemonic in mnemonics[family]])
+    fingerprints['decode'] = fingerprint(generator, [inst.orig for inst in insts])
+    fingerprints['batch'] = fingerprint(generator, [inst.orig for inst in insts])
+    fingerprints['runtime'] = fingerprint(generator, [inst.orig for inst in insts])
+
+    stale = [
+        name for name, value in fingerprints.items()
+        if manifest.get(name) != value or not os.path.exists(os.path.join(directory, f'{name}.hpp'))
+    ]
+    stale_mnemonics = set().union(*[mnemonics[family] for family in FAMILIES if family in stale])
+    results = generate_instructions([inst for inst in insts if inst.mnemonic in stale_mnemonics], jobs)
+
+    files = {}
+    if 'base' in stale:
+        files['base'] = HEADER + '}\n'
+    if 'assembler' in stale:
+        files['assembler'] = header(['base.hpp'], ASSEMBLER)
+    for family in FAMILIES:
+        if family in stale:
+            files[family] = header(['base.hpp'], ''.join(texts.get(family, '') for texts in results))
+    if 'decode' in stale:
+        files['decode'] = header(['base.hpp'], generate_decode_header(insts))
+    if 'batch' in stale:
+        out = Emitter(None)
+        out.lines(generate_batch_table(insts))
+        files['batch'] = header(['assembler.hpp'], out.text())
+    if 'runtime' in stale:
+        out = Emitter(None)
+        out.lines(generate_runtime_encoders(insts))
+        files['runtime'] = header(['base.hpp'], out.text())
+
+    for name, text in files.items():
+        write_if_changed(os.path.join(directory, f'{name}.hpp'), text)
+
+    write_if_changed(os.path.join(path, 'x86.hpp'), '#pragma once\n\n' + ''.join(f'#include "x86/{name}.hpp"\n' for name in fingerprints))
+    write_if_changed(manifest_path, json.dumps(fingerprints, indent=4) + '\n')
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the x86 encoder header from the instruction database.')
+    parser.add_argument('input', nargs='?', help='instruction database (.idb), json or idb on stdin if omitted')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='worker processes, 0 uses every core')
+    parser.add_argument('-o', '--output', help='include directory for x86.hpp and the per-family headers in x86/, '
+                        'a single header is written to stdout if omitted')
+    parser.add_argument('-p', '--python', help='also write the pure-Python encoder module to this path')
+    args = parser.parse_args()
+
+    insts = []
+    for inst in load_instructions(args.input):
+        try:
+            insts.append(preproccess(inst))
+        except:
+            pass
+
+    if args.python:
+        write_if_changed(args.python, generate_python_module(insts))
+
+    if args.output:
+        write_split(args.output, insts, args.jobs)
+        return
+
+    out = Emitter(sys.stdout)
+    out.raw(HEADER)
+    out.raw(ASSEMBLER)
+    for texts in generate_instructions(insts, args.jobs):
+        out.raw(''.join(texts.values()))
+    out.raw(generate_decode_header(insts))
+    out.lines(generate_batch_table(insts))
+    out.lines(generate_runtime_encoders(insts))
+    out.raw('}\n')
+    out.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# Compact columnar instruction table shared by fetch.py and generate.py.
+#
+# Layout (little-endian, every section 4-byte aligned):
+#   header       MAGIC, u32 version, u32 rows, u32 columns, u32 strings
+#   columns      u32 name string id, u32 offset of the column data
+#   string index u32[strings + 1] offsets into the string blob
+#   string blob  utf-8, every distinct cell value and column name once
+#   column data  u32[rows] string ids per column, 0 means no value
+#
+# Opening a table only reads the header and the column directory, columns
+# and strings are decoded lazily straight out of the (memory-mapped) buffer.
+
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b'X86IDB\0\0'
+VERSION = 1
+
+HEADER = struct.Struct('<8sIIII')
+COLUMN = struct.Struct('<II')
+
+def align(size: int) -> int:
+    return (size + 3) & ~3
+
+def u32(values) -> bytes:
+    data = array('I', values)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+def dumps(rows: list[dict]) -> bytes:
+    strings = {None: 0}
+    def intern(value) -> int:
+        return strings.setdefault(value, len(strings))
+
+    names = list(dict.fromkeys(k for row in rows for k in row))
+    name_ids = [intern(name) for name in names]
+    columns = [[intern(row.get(name)) for row in rows] for name in names]
+
+    blob = bytearray()
+    offsets = [0, 0]
+    for string in list(strings)[1:]:
+        blob += string.encode()
+        offsets.append(len(blob))
+    blob += bytes(align(len(blob)) - len(blob))
+
+    data_offset = HEADER.size + COLUMN.size * len(names) + 4 * len(offsets) + len(blob)
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, len(rows), len(names), len(strings)))
+    for i, name_id in enumerate(name_ids):
+        out += COLUMN.pack(name_id, data_offset + 4 * len(rows) * i)
+    out += u32(offsets)
+    out += blob
+    for column in columns:
+        out += u32(column)
+
+    return bytes(out)
+
+def dump(rows: list[dict], f):
+    f.write(dumps(rows))
+
+class Table:
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer)
+
+        magic, version, self.nrows, ncols, self.nstrings = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC:
+            raise ValueError('not an instruction database')
+        if version != VERSION:
+            raise ValueError(f'unsupported instruction database version {version}')
+
+        pos = HEADER.size + COLUMN.size * ncols
+        self.offsets = self.words(pos, self.nstrings + 1)
+        self.blob = pos + 4 * (self.nstrings + 1)
+        self.strings = [None] * self.nstrings
+
+        self.columns = {}
+        for i in range(ncols):
+            name_id, offset = COLUMN.unpack_from(self.buffer, HEADER.size + COLUMN.size * i)
+            self.columns[self.string(name_id)] = offset
+
+    @classmethod
+    def open(cls, path: str) -> 'Table':
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def words(self, offset: int, count: int):
+        words = self.buffer[offset:offset + 4 * count]
+        if sys.byteorder == 'little':
+            return words.cast('I')
+        words = array('I', words)
+        words.byteswap()
+        return words
+
+    def string(self, id: int):
+        string = self.strings[id]
+        if string is None and id:
+            begin, end = self.offsets[id], self.offsets[id + 1]
+            string = self.strings[id] = str(self.buffer[self.blob + begin:self.blob + end], 'utf-8')
+        return string
+
+    def __len__(self) -> int:
+        return self.nrows
+
+    def ids(self, name: str):
+        if name not in self.columns:
+            return [0] * self.nrows
+        return self.words(self.columns[name], self.nrows)
+
+    def column(self, name: str) -> list:
+        return [self.string(id) for id in self.ids(name)]
+
+    def rows(self, names: list[str] = None) -> list[dict]:
+        names = names or list(self.columns)
+        columns = [(name, self.ids(name)) for name in names]
+        return [
+            {name: self.string(ids[i]) for name, ids in columns if ids[i]}
+            for i in range(self.nrows)
+        ]
@@ -0,0 +1,590 @@
+#!/bin/python3
+
+# Resident assembler backend of the x86 REPL.
+#
+# Reads one command per line on stdin and answers each with one line:
+#   a <source line>  assemble and append a line       ok <hex of its bytes>
+#   l <file>         assemble and append a whole file ok <hex of its bytes>
+#   u                drop the last line or file       ok <offset of the new end>
+#   b                whole program                    ok <hex>
+#   p                program source                   ok <number of lines>, followed by the lines
+#   w <file>         save the program source          ok
+#   x [iterations]   run the program in a loop        ok iterations=<n> cycles/iteration=<n> rax=<value> ...
+# Failures answer "error <message>" and leave the program unchanged.
+#
+# Lines are encoded with the generated Python encoder (build/x86.py) when it
+# knows the instruction form, everything else is handed to nasm on its own,
+# assembled at the current offset with the labels defined so far.
+# `repl.py --check` compares the two on every form of the encoder.
+
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+BUILD = os.path.join(ROOT, 'build')
+
+LABEL = re.compile(r'^\s*([A-Za-z_.?][\w.?$#@~]*):(.*)$')
+# source() starts with this directive, every line is assembled in 64-bit mode anyway
+BITS_64 = re.compile(r'^\s*\[?\s*bits\s+64\s*\]?\s*(;.*)?$', re.I)
+SIZES = {'byte': 8, 'word': 16, 'dword': 32, 'qword': 64, 'tword': 80, 'oword': 128}
+HIGH_BYTES = {'ah', 'ch', 'dh', 'bh'}
+# stack operations and indirect branches have no 32-bit operand size in long mode
+DEFAULT_64 = {'push', 'pop', 'call', 'jmp', 'leave'}
+
+def registers() -> dict:
+    regs = {}
+    names = {
+        8: ['al', 'cl', 'dl', 'bl', 'ah', 'ch', 'dh', 'bh'] + [f'r{i}b' for i in range(8, 16)],
+        16: ['ax', 'cx', 'dx', 'bx', 'sp', 'bp', 'si', 'di'] + [f'r{i}w' for i in range(8, 16)],
+        32: ['eax', 'ecx', 'edx', 'ebx', 'esp', 'ebp', 'esi', 'edi'] + [f'r{i}d' for i in range(8, 16)],
+        64: ['rax', 'rcx', 'rdx', 'rbx', 'rsp', 'rbp', 'rsi', 'rdi'] + [f'r{i}' for i in range(8, 16)],
+    }
+    for width, group in names.items():
+        for id, name in enumerate(group):
+            regs[name] = ('gp', width, id)
+    for id in range(8):
+        regs[f'mm{id}'] = ('mm', 64, id)
+    for id in range(16):
+        regs[f'xmm{id}'] = ('xmm', 128, id)
+    return regs
+
+REGISTERS = registers()
+
+def number(text: str):
+    text = text.strip().replace('_', '')
+    try:
+        if text.lower().endswith('h') and re.match(r'^-?[0-9][0-9a-f]*h$', text, re.I):
+            return int(text[:-1], 16)
+        return int(text, 0)
+    except ValueError:
+        return None
+
+class Unsupported(Exception):
+    pass
+
+class Operand:
+    def __init__(self, kind, width = None, value = None, name = None):
+        self.kind = kind
+        self.width = width
+        self.value = value
+        self.name = name
+
+def parse_memory(text: str, width, x86) -> Operand:
+    base, index, scale, disp = None, x86.NO_INDEX, 1, 0
+    for sign, term in re.findall(r'([+-]?)\s*([^+-]+)', text):
+        term = term.strip().lower()
+        factors = [factor.strip() for factor in term.split('*')]
+        regs = [factor for factor in factors if factor in REGISTERS]
+        if not regs:
+            value = number(term)
+            if value is None or len(factors) > 1:
+                raise Unsupported(term)
+            disp += sign == '-' and -value or value
+            continue
+
+        cls, reg_width, id = REGISTERS[regs[0]]
+        if sign == '-' or cls != 'gp' or reg_width != 64 or len(regs) > 1 or len(factors) > 2:
+            raise Unsupported(term)
+        if len(factors) == 1 and base is None:
+            base = id
+        elif index == x86.NO_INDEX:
+            index = id
+            if len(factors) == 2:
+                scale = number(factors[1 - factors.index(regs[0])])
+                if scale not in (1, 2, 4, 8):
+                    raise Unsupported(term)
+        else:
+            raise Unsupported(term)
+
+    if base is None or not -(1 << 31) <= disp < (1 << 31):
+        raise Unsupported(text)
+    try:
+        return Operand('mem', width, x86.Mem(base, index, scale, disp))
+    except ValueError:
+        raise Unsupported(text)
+
+def parse_operand(text: str, x86) -> Operand:
+    text = text.strip()
+    words = text.split(None, 1)
+    width = None
+    if len(words) == 2 and words[0].lower() in SIZES:
+        width = SIZES[words[0].lower()]
+        text = words[1].strip()
+
+    if text.startswith('[') and text.endswith(']'):
+        return parse_memory(text[1:-1], width, x86)
+    if width is not None:
+        raise Unsupported(text)
+    if text.lower() in REGISTERS:
+        cls, width, id = REGISTERS[text.lower()]
+        return Operand(cls, width, id, text.lower())
+
+    value = number(text)
+    if value is None:
+        raise Unsupported(text)
+    return Operand('imm', value=value)
+
+def operand_tokens(operand: Operand, operands: list) -> list[str]:
+    if operand.kind == 'gp':
+        return [f'RM{operand.width}', f'R{operand.width}']
+    elif operand.kind == 'mm':
+        return ['MM', 'MMM64']
+    elif operand.kind == 'xmm':
+        return ['XMM', 'XMMM128', 'XMMM64', 'XMMM32']
+    elif operand.kind == 'mem':
+        width = operand.width
+        if width is None:
+            # the size of an unsized memory operand comes from the registers
+            widths = {other.width for other in operands if other.kind == 'gp'}
+            width = len(widths) == 1 and widths.pop() or None
+            tokens = ['M']
+            if width:
+                tokens.append(f'RM{width}')
+            if any(other.kind == 'xmm' for other in operands):
+                tokens += ['XMMM128', 'XMMM64', 'XMMM32']
+            if any(other.kind == 'mm' for other in operands):
+                tokens.append('MMM64')
+            return tokens
+        return [f'RM{width}', f'M{width}', f'M{width}REAL', f'M{width}INT', f'XMMM{width}', f'MMM{width}']
+
+    value = operand.value
+    return [*(value == 1 and ['1'] or []), *[f'I{bits}' for bits in (8, 16, 32, 64) if -(1 << (bits - 1)) <= value < (1 << bits)]]
+
+def immediate_fits(value: int, bits: int, width) -> bool:
+    # immediates narrower than the operand are sign-extended
+    if width and bits < width:
+        return -(1 << (bits - 1)) <= value < (1 << (bits - 1))
+    return -(1 << (bits - 1)) <= value < (1 << bits)
+
+def encode_native(line: str, x86) -> bytes:
+    mnemonic, _, rest = line.strip().partition(' ')
+    operands = [parse_operand(text, x86) for text in rest.split(',')] if rest.strip() else []
+    if any(operand.name in ('spl', 'bpl', 'sil', 'dil') for operand in operands):
+        raise Unsupported(line)
+    if mnemonic.lower() in DEFAULT_64 and any(operand.width == 32 for operand in operands):
+        raise Unsupported(line)
+
+    choices = [operand_tokens(operand, operands) for operand in operands]
+    candidates = [[]]
+    for tokens in choices:
+        candidates = [candidate + [token] for candidate in candidates for token in tokens]
+
+    best = None
+    for tokens in candidates + [['ST'] + tokens for tokens in candidates]:
+        name = '_'.join([mnemonic.upper(), *tokens])
+        op = FORM_IDS.get(name)
+        if op is None:
+            continue
+
+        width = max([int(token[len(token.rstrip('0123456789')):] or 0) for token in tokens if token.startswith(('R', 'M'))] or [0])
+        args, imm = [], 0
+        for token, operand in zip([token for token in tokens if token != 'ST'], operands):
+            if token.startswith('I'):
+                if not immediate_fits(operand.value, int(token[1:]), width):
+                    break
+                imm = operand.value
+            elif token != '1':
+                args.append(operand.value)
+        else:
+            try:
+                code = x86.encode(op, *args, imm=imm)
+            except ValueError:
+                # AH-BH next to a REX prefix
+                continue
+            prefixes = len(x86.FORMS[op][0])
+            # encoders generated before that check return SPL-DIL instead
+            if any(operand.name in HIGH_BYTES for operand in operands) and 0x40 <= code[prefixes] <= 0x4F:
+                continue
+            if best is None or len(code) < len(best):
+                best = code
+
+    if best is None:
+        raise Unsupported(line)
+    return best
+
+def encode_nasm(source: str, offset: int, labels: dict) -> bytes:
+    source = 'BITS 64\n' + f'org {offset}\n' + ''.join(f'{name} equ {value}\n' for name, value in labels.items()) + source + '\n'
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'line.asm')
+        with open(path, 'w') as f:
+            f.write(source)
+        try:
+            result = subprocess.run(['nasm', '-f', 'bin', '-Werror', '-o', path + '.bin', path], capture_output=True, text=True)
+        except FileNotFoundError:
+            raise ValueError('nasm not found')
+        if result.returncode:
+            raise ValueError(' '.join(result.stderr.replace(path + ':', '').split()))
+        with open(path + '.bin', 'rb') as f:
+            return f.read()
+
+GP_NAMES = ['rax', 'rcx', 'rdx', 'rbx', 'rsp', 'rbp', 'rsi', 'rdi'] + [f'r{i}' for i in range(8, 16)]
+
+def harness(code: bytes) -> bytes:
+    """uint64_t (*)(uint64_t regs[16], uint64_t loops)
+
+    Zeroes the general purpose registers, runs the code `loops` times
+    between two fenced RDTSCs, stores the final registers to regs and
+    returns the elapsed TSC cycles. The loop counter lives on the stack so
+    the code may use every register but rsp.
+    """
+    fenced_rdtsc = bytes([0x0F, 0xAE, 0xE8, 0x0F, 0x31, 0x0F, 0xAE, 0xE8, 0x48, 0xC1, 0xE2, 0x20, 0x48, 0x09, 0xD0])
+    out = bytes([0x53, 0x55, 0x41, 0x54, 0x41, 0x55, 0x41, 0x56, 0x41, 0x57, 0x57, 0x56])  # push callee-saved, regs, loops
+    out += fenced_rdtsc + bytes([0x50])                                                      # push start
+    for id in range(16):
+        if id != 4:
+            out += bytes([*(id >= 8 and [0x45] or []), 0x31, 0xC0 | (id & 7) << 3 | id & 7]) # xor r32, r32
+    out += code
+    out += bytes([0x48, 0xFF, 0x4C, 0x24, 0x08, 0x0F, 0x85])                                 # dec qword [rsp+8]; jnz
+    out += (-(len(code) + 11)).to_bytes(4, 'little', signed=True)
+    out += bytes([0x50, 0x48, 0x8B, 0x44, 0x24, 0x18])                                       # push rax; mov rax, [rsp+24]
+    for id in range(1, 16):
+        if id != 4:
+            out += bytes([id >= 8 and 0x4C or 0x48, 0x89, 0x40 | (id & 7) << 3, 8 * id])     # mov [rax+8*id], r64
+    out += bytes([0x59, 0x48, 0x89, 0x08])                                                   # pop rcx; mov [rax], rcx
+    out += fenced_rdtsc
+    out += bytes([0x59, 0x48, 0x29, 0xC8, 0x59, 0x59])                                       # pop rcx; sub rax, rcx; pop; pop
+    out += bytes([0x41, 0x5F, 0x41, 0x5E, 0x41, 0x5D, 0x41, 0x5C, 0x5D, 0x5B, 0xC3])         # pop callee-saved; ret
+    return out
+
+def execute(code: bytes, loops: int) -> tuple[int, list[int]]:
+    import ctypes
+    import mmap
+
+    page = mmap.mmap(-1, len(code) + mmap.PAGESIZE - 1 & -mmap.PAGESIZE, prot=mmap.PROT_READ | mmap.PROT_WRITE)
+    page.write(code)
+    address = ctypes.addressof(ctypes.c_char.from_buffer(page))
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.mprotect.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int]
+    if libc.mprotect(address, len(page), mmap.PROT_READ | mmap.PROT_EXEC):
+        raise OSError(ctypes.get_errno(), 'mprotect failed')
+
+    regs = (ctypes.c_uint64 * 16)()
+    cycles = ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p, ctypes.c_uint64)(address)(regs, loops)
+    return cycles, list(regs)
+
+def measure(code: bytes, iterations: int, unroll: int = 16, repeat: int = 5, timeout: int = 10) -> tuple[int, float, list[int]]:
+    """Iterations run, TSC cycles per iteration and the registers after the last one.
+
+    The code is unrolled so the loop counter in memory does not hide short
+    dependency chains, the iterations are rounded up to a multiple of
+    `unroll` and the cost of the empty loop is subtracted. Runs in a child
+    process so a crashing or hanging snippet can not take the REPL down; the
+    fastest of `repeat` runs is kept.
+    """
+    import platform
+    import signal
+
+    if not sys.platform.startswith('linux') or platform.machine() != 'x86_64':
+        raise ValueError('running code needs x86-64 Linux')
+    if iterations < 1:
+        raise ValueError('iterations must be positive')
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if not pid:
+        try:
+            os.close(read)
+            signal.alarm(timeout)
+            loops = -(-iterations // unroll)
+            empty = min(execute(harness(b''), loops)[0] for _ in range(repeat))
+            cycles, regs = min(execute(harness(code * unroll), loops) for _ in range(repeat))
+            os.write(write, json.dumps([loops * unroll, (cycles - empty) / (loops * unroll), regs]).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read, 'rb') as f:
+        result = f.read()
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        raise ValueError(f'killed by {signal.Signals(os.WTERMSIG(status)).name}')
+    if not result:
+        raise ValueError('could not run the code')
+    iterations, cycles, regs = json.loads(result)
+    return iterations, cycles, regs
+
+def load_encoder():
+    global FORM_IDS
+    if FORM_IDS:
+        return sys.modules['x86']
+    sys.path.insert(0, BUILD)
+    try:
+        import x86
+    except ImportError:
+        x86 = None
+    finally:
+        sys.path.pop(0)
+    FORM_IDS = x86 and {name: i for i, name in enumerate(x86.FORM_NAMES)} or {}
+    return x86
+
+FORM_IDS = {}
+
+class Session:
+    def __init__(self):
+        self.x86 = load_encoder()
+        self.code = bytearray()
+        # every undo step: its source lines, the end offset of its bytes and the labels it defines
+        self.lines = []
+        self.ends = []
+        self.line_labels = []
+        self.labels = {}
+
+    def label(self, line: str):
+        match = LABEL.match(line.split(';', 1)[0])
+        if match and not match.group(1).lower() in REGISTERS:
+            return match.group(1), match.group(2).strip()
+        return None, line.split(';', 1)[0].strip()
+
+    def assemble(self, line: str, fallback: bool = True):
+        label, source = self.label(line)
+        if label in self.labels:
+            raise ValueError(f'label `{label}\' redefined')
+
+        code = b''
+        if source:
+            try:
+                if not self.x86:
+                    raise Unsupported(source)
+                code = encode_native(source, self.x86)
+            except Unsupported:
+                if not fallback:
+                    raise
+                labels = {**self.labels, **(label and {label: len(self.code)} or {})}
+                code = encode_nasm(source, len(self.code), labels)
+        return label, code
+
+    def push(self, lines: list[str], code: bytes, labels: dict):
+        self.labels.update(labels)
+        self.lines.append(lines)
+        self.line_labels.append(list(labels))
+        self.code += code
+        self.ends.append(len(self.code))
+
+    def append(self, line: str) -> bytes:
+        label, code = self.assemble(line)
+        self.push([line], code, label and {label: len(self.code)} or {})
+        return code
+
+    def load(self, lines: list[str]) -> bytes:
+        lines = [line for line in lines if not BITS_64.match(line)]
+        start, steps = len(self.code), len(self.lines)
+        try:
+            for line in lines:
+                label, code = self.assemble(line, fallback=False)
+                self.push([line], code, label and {label: len(self.code)} or {})
+            return self.code[start:]
+        except (Unsupported, ValueError):
+            while len(self.lines) > steps:
+                self.undo()
+
+        # one nasm run for the whole file, the values of its labels are
+        # appended as a table of qwords and cut off again
+        names = [name for name, _ in map(self.label, lines) if name and not name.startswith('.')]
+        for name in names:
+            if name in self.labels:
+                raise ValueError(f'label `{name}\' redefined')
+        source = '\n'.join(lines) + (names and '\ndq ' + ', '.join(names) or '')
+        code = encode_nasm(source, start, self.labels)
+        table, code = code[len(code) - 8 * len(names):], code[:len(code) - 8 * len(names)]
+        labels = {name: int.from_bytes(table[8 * i:8 * i + 8], 'little') for i, name in enumerate(names)}
+        self.push(lines, code, labels)
+        return code
+
+    def undo(self) -> int:
+        if self.lines:
+            self.lines.pop()
+            self.ends.pop()
+            for label in self.line_labels.pop():
+                del self.labels[label]
+            del self.code[self.ends and self.ends[-1] or 0:]
+        return len(self.code)
+
+    def source(self) -> list[str]:
+        return ['BITS 64'] + [line for lines in self.lines for line in lines]
+
+def serve(session: Session, input, output):
+    for command in input:
+        command = command.rstrip('\n')
+        op, _, arg = command.partition(' ')
+        try:
+            if op == 'a':
+                reply = 'ok ' + session.append(arg).hex()
+            elif op == 'l':
+                with open(arg) as f:
+                    reply = 'ok ' + session.load([line.rstrip('\n') for line in f]).hex()
+            elif op == 'u':
+                reply = f'ok {session.undo()}'
+            elif op == 'b':
+                reply = 'ok ' + session.code.hex()
+            elif op == 'p':
+                source = session.source()
+                reply = f'ok {len(source)}\n' + '\n'.join(source)
+            elif op == 'w':
+                with open(arg, 'w') as f:
+                    f.write('\n'.join(session.source()) + '\n')
+                reply = 'ok'
+            elif op == 'x':
+                iterations, cycles, regs = measure(bytes(session.code), int(arg or 1 << 16))
+                reply = f'ok iterations={iterations} cycles/iteration={cycles:.2f} ' + ' '.join(f'{name}={reg:#x}' for name, reg in zip(GP_NAMES, regs) if name != 'rsp')
+            else:
+                reply = f'error unknown command {op}'
+        except OSError as e:
+            reply = f'error {e.strerror}: {arg}'
+        except ValueError as e:
+            reply = f'error {e}'
+        output.write(reply + '\n')
+        output.flush()
+
+def snippets(files: list[str]):
+    """Yields (name, lines) of every file, blank line separated snippets of stdin without files."""
+    for file in files:
+        with open(file) as f:
+            yield file, [line.rstrip('\n') for line in f]
+    if files:
+        return
+
+    lines = []
+    for line in sys.stdin:
+        if line.strip():
+            lines.append(line.rstrip('\n'))
+        elif lines:
+            yield '-', lines
+            lines = []
+    if lines:
+        yield '-', lines
+
+def batch(files: list[str], output) -> int:
+    """Assembles every snippet from offset 0 and writes a JSON line per source line."""
+    errors = 0
+    for snippet, (name, lines) in enumerate(snippets(files)):
+        session = Session()
+        for number, line in enumerate(lines, 1):
+            if not line.split(';', 1)[0].strip():
+                continue
+            result = {'snippet': snippet, 'file': name, 'line': number, 'offset': len(session.code)}
+            try:
+                result['bytes'] = session.append(line).hex()
+            except ValueError as e:
+                result['error'] = str(e)
+                errors += 1
+            result['source'] = line
+            output.write(json.dumps(result) + '\n')
+    output.flush()
+    return errors and 1 or 0
+
+SIZE_NAMES = {width: name for name, width in SIZES.items()}
+ADDRESSES = ['[rax]', '[rbp]', '[r13+0x8]', '[rsp+rax*2-0x80]', '[rbx+rax*4]', '[r12+r9*8+0x12345]']
+SAMPLES = {
+    'gp': {8: ['al', 'bh', 'r9b'], 16: ['ax', 'si', 'r10w'], 32: ['eax', 'edi', 'r13d'], 64: ['rax', 'rsp', 'r12']},
+    'MM': ['mm0', 'mm7'],
+    'XMM': ['xmm0', 'xmm9', 'xmm15'],
+    'I8': ['0x7f', '-2'],
+    'I16': ['0x1234', '-2'],
+    'I32': ['0x12345678', '-0x80000000'],
+    'I64': ['0x123456789abcdef0'],
+    '1': ['1'],
+}
+
+def operand_samples(token: str) -> list[str]:
+    width = int(token[len(token.rstrip('0123456789')):] or 0)
+    kind = token.rstrip('0123456789')
+    if token in SAMPLES:
+        return SAMPLES[token]
+    elif kind == 'R':
+        return SAMPLES['gp'][width]
+    elif kind == 'RM':
+        return SAMPLES['gp'][width] + [f'{SIZE_NAMES[width]} {address}' for address in ADDRESSES]
+    elif kind in ('MMM', 'XMMM'):
+        return SAMPLES[kind[:-1]] + [f'{SIZE_NAMES[width]} {address}' for address in ADDRESSES]
+    elif kind == 'M' or token.startswith('M') and width in SIZE_NAMES:
+        return [width and f'{SIZE_NAMES[width]} {address}' or address for address in ADDRESSES]
+    return []
+
+def corpus(x86) -> list[str]:
+    """Sample lines for every form of the encoder, ST operands are implicit."""
+    lines = []
+    for name in x86.FORM_NAMES:
+        mnemonic, *tokens = name.split('_')
+        choices = [operand_samples(token) for token in tokens if token != 'ST']
+        for operands in itertools.product(*choices):
+            if sum(operand.endswith(']') for operand in operands) < 2:
+                lines.append(' '.join([mnemonic.lower(), ', '.join(operands)]).strip())
+    return lines
+
+def encode_nasm_lines(lines: list[str]) -> list:
+    """nasm's bytes for every line, or the ValueError it fails with."""
+    try:
+        names = [f'check_{i}' for i in range(len(lines) + 1)]
+        source = ''.join(f'{name}: {line}\n' for name, line in zip(names, lines)) + f'{names[-1]}:\ndq ' + ', '.join(names)
+        code = encode_nasm(source, 0, {})
+        table = code[len(code) - 8 * len(names):]
+        starts = [int.from_bytes(table[8 * i:8 * i + 8], 'little') for i in range(len(names))]
+        return [code[start:end] for start, end in zip(starts, starts[1:])]
+    except ValueError:
+        # some line does not assemble, find out which
+        results = []
+        for line in lines:
+            try:
+                results.append(encode_nasm(line, 0, {}))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+def check(lines: list[str], output) -> int:
+    """Encodes every line natively and with nasm, writes a JSON line for every disagreement.
+
+    Encodings count as equal when they disassemble to the same text, nasm
+    is free to pick e.g. 01 /r instead of 03 /r for a register move.
+    """
+    x86 = load_encoder()
+    if not x86:
+        raise SystemExit(f'no encoder in {BUILD}, run make first')
+
+    native = []
+    for line in lines:
+        try:
+            native.append((line, encode_native(line, x86)))
+        except Unsupported:
+            pass
+
+    def text(code: bytes) -> list[str]:
+        return [text for _, _, text in x86.disassemble(code)]
+
+    errors = 0
+    for (line, code), expected in zip(native, encode_nasm_lines([line for line, _ in native])):
+        result = {'source': line, 'bytes': code.hex()}
+        if isinstance(expected, ValueError):
+            result['error'] = str(expected)
+        elif code != expected and text(code) != text(expected):
+            result['nasm'] = expected.hex()
+        else:
+            continue
+        errors += 1
+        output.write(json.dumps(result) + '\n')
+    output.write(json.dumps({'lines': len(lines), 'native': len(native), 'mismatches': errors}) + '\n')
+    output.flush()
+    return errors and 1 or 0
+
+if __name__ == '__main__':
+    import argparse
+
+    args = argparse.ArgumentParser(description='Resident assembler backend of the x86 REPL')
+    args.add_argument('--batch', action='store_true', help='assemble snippets and print JSON lines instead of serving the REPL')
+    args.add_argument('--check', action='store_true', help='compare the native encoder with nasm and print the lines they disagree on')
+    args.add_argument('files', nargs='*', help='snippet files for --batch, source lines for --check (default: stdin for --batch, a sample of every form for --check)')
+    args = args.parse_args()
+
+    if args.check:
+        if not shutil.which('nasm'):
+            raise SystemExit('--check needs nasm')
+        lines = [line.split(';', 1)[0].strip() for file in args.files for line in open(file)]
+        sys.exit(check([line for line in lines if line and not LABEL.match(line)] or corpus(load_encoder()), sys.stdout))
+    if args.batch:
+        sys.exit(batch(args.files, sys.stdout))
+    serve(Session(), sys.stdin, sys.stdout)